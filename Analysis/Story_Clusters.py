@@ -0,0 +1,189 @@
+"""Agrupación de artículos de distintos periódicos en "historias" (TF-IDF vectorizado).
+
+- Cada artículo se vectoriza con TF-IDF sobre el texto de `TextUtils.cleantext`
+  (título + subtítulo + cuerpo), con el truco del hashing: no hay vocabulario
+  que mantener entre ejecuciones.
+- Los vectores son filas de una matriz dispersa de SciPy normalizada (L2):
+  la similitud coseno contra todas las historias es un único producto
+  `X_nuevos @ C.T`, sin comparaciones por pares en Python.
+- Incremental: los artículos que ya tienen `story_id` fijan las historias; los
+  nuevos se asignan a la historia cuyo centroide es más parecido o abren una
+  nueva. `story_id` es el `id` del primer artículo de la historia.
+
+Reagrupar todo el histórico (desde la raíz del repositorio):
+    python -m Analysis.Story_Clusters [--input noticias_completas.json] [--threshold 0.35]
+"""
+import argparse
+import json
+import re
+import zlib
+
+import numpy as np
+from scipy import sparse
+
+from Utils.Text_Utils import TextUtils
+
+_WORD = re.compile(r'\w+')
+# Palabras vacías frecuentes (el IDF hace el resto)
+_STOPWORDS = frozenset("""
+    que los las del por con una para como mas pero sus este esta esto ese esa son fue han
+    sido ser hay muy sin sobre entre tambien desde hasta porque cuando donde todo todos
+    ante tras segun durante ya asi les unos unas otro otra otros otras dos tres
+""".split())
+
+
+class StoryClusterer:
+    """Asigna `story_id` a artículos por similitud coseno TF-IDF."""
+
+    def __init__(self, threshold=0.35, n_features=2 ** 18, block_rows=512):
+        self.threshold = threshold
+        self.n_features = n_features
+        self.block_rows = block_rows
+
+    # ── vectores ────────────────────────────────────────────
+
+    @staticmethod
+    def tokens(article):
+        text = ' '.join(str(article.get(k) or '') for k in ('title', 'subtitle', 'body'))
+        words = _WORD.findall(TextUtils.cleantext(text).lower())
+        return [w for w in words if len(w) > 2 and w not in _STOPWORDS and not w.isdigit()]
+
+    def vectorize(self, articles):
+        """Matriz CSR (artículos × n_features) TF-IDF con TF sublineal y filas L2."""
+        rows, cols, counts = [], [], []
+        for i, art in enumerate(articles):
+            tf = {}
+            for token in self.tokens(art):
+                h = zlib.crc32(token.encode('utf-8')) % self.n_features
+                tf[h] = tf.get(h, 0) + 1
+            rows.extend([i] * len(tf))
+            cols.extend(tf.keys())
+            counts.extend(tf.values())
+        n = len(articles)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = 1.0 + np.log(np.asarray(counts, dtype=np.float32))
+        matrix = sparse.csr_matrix((values, (np.asarray(rows, dtype=np.int64), cols)),
+                                   shape=(n, self.n_features), dtype=np.float32)
+        # Cada columna aparece una vez por fila: bincount = frecuencia documental
+        df = np.bincount(cols, minlength=self.n_features)
+        idf = (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+        return self._normalize(matrix @ sparse.diags(idf))
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+    # ── asignación ──────────────────────────────────────────
+
+    def assign(self, articles):
+        """Asigna `story_id` a los artículos de `articles` que no lo tienen.
+
+        `articles` es la ventana completa (histórico + nuevos); los que ya
+        tienen `story_id` definen las historias existentes. Los pendientes se
+        procesan en orden de `scraped_at`. Devuelve el número de asignados.
+        """
+        assigned = [a for a in articles if a.get('story_id')]
+        pending = sorted((a for a in articles if not a.get('story_id') and a.get('id')),
+                         key=lambda a: a.get('scraped_at') or '')
+        if not pending:
+            return 0
+
+        X = self.vectorize(assigned + pending)
+        X_old, X_new = X[:len(assigned)], X[len(assigned):]
+
+        # Centroides de las historias existentes: indicadora (historias × artículos) @ X
+        story_ids = list(dict.fromkeys(a['story_id'] for a in assigned))
+        centroids = None
+        if story_ids:
+            position = {s: i for i, s in enumerate(story_ids)}
+            labels = np.fromiter((position[a['story_id']] for a in assigned), dtype=np.int64)
+            membership = sparse.csr_matrix(
+                (np.ones(len(assigned), dtype=np.float32), (labels, np.arange(len(assigned)))),
+                shape=(len(story_ids), len(assigned))
+            )
+            centroids = self._normalize(membership @ X_old).T.tocsr()
+
+        # Por bloques de filas: la memoria queda acotada a `block_rows` × pendientes
+        # y al bucle en Python solo llegan las similitudes por encima del umbral
+        for b0 in range(0, len(pending), self.block_rows):
+            b1 = min(b0 + self.block_rows, len(pending))
+            block = X_new[b0:b1]
+            best_story = np.full(b1 - b0, -1)
+            best_sim = np.zeros(b1 - b0, dtype=np.float32)
+            if centroids is not None:
+                similarity = (block @ centroids).tocsr()
+                best_story = np.asarray(similarity.argmax(axis=1)).ravel()
+                best_sim = similarity.max(axis=1).toarray().ravel()
+
+            # Pendientes entre sí: solo columnas anteriores al bloque o dentro de él (j < i)
+            pairwise = (block @ X_new[:b1].T).tocsr()
+            pairwise.data[pairwise.data < self.threshold] = 0
+            pairwise.eliminate_zeros()
+            pairwise.sort_indices()
+            for r in range(b1 - b0):
+                i = b0 + r
+                story, score = None, self.threshold
+                if best_sim[r] >= score:
+                    story, score = story_ids[best_story[r]], best_sim[r]
+                start, end = pairwise.indptr[r], pairwise.indptr[r + 1]
+                for j, sim in zip(pairwise.indices[start:end], pairwise.data[start:end]):
+                    if j < i and sim >= score:
+                        story, score = pending[j]['story_id'], sim
+                pending[i]['story_id'] = story or pending[i]['id']
+        return len(pending)
+
+    # ── resumen ─────────────────────────────────────────────
+
+    @staticmethod
+    def stories(articles, min_size=2):
+        """Historias con al menos `min_size` artículos, las más recientes primero."""
+        groups = {}
+        for art in sorted(articles, key=lambda a: a.get('scraped_at') or ''):
+            if art.get('story_id'):
+                groups.setdefault(art['story_id'], []).append(art)
+        stories = []
+        for story_id, members in groups.items():
+            if len(members) < min_size:
+                continue
+            stories.append({
+                'story_id': story_id,
+                'title': members[0].get('title', ''),
+                'size': len(members),
+                'newspapers': sorted({m.get('newspaper') or m.get('domain', '') for m in members}),
+                'first_seen': members[0].get('scraped_at'),
+                'last_seen': members[-1].get('scraped_at'),
+                'articles': [{k: m.get(k) for k in ('id', 'newspaper', 'title', 'url')} for m in members],
+            })
+        stories.sort(key=lambda s: (s['last_seen'] or '', s['size']), reverse=True)
+        return stories
+
+    def write_stories(self, articles, path, min_size=2):
+        stories = self.stories(articles, min_size)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(stories, f, ensure_ascii=False, indent=2)
+        return stories
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reagrupa el histórico en historias (story_id)')
+    parser.add_argument('--input', default='noticias_completas.json')
+    parser.add_argument('--output', default='historias.json')
+    parser.add_argument('--threshold', type=float, default=0.35, help='Similitud coseno mínima')
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        articles = json.load(f)
+    for art in articles:
+        art.pop('story_id', None)
+    clusterer = StoryClusterer(args.threshold)
+    clusterer.assign(articles)
+    stories = clusterer.write_stories(articles, args.output)
+    with open(args.input, 'w', encoding='utf-8') as f:
+        json.dump(articles, f, ensure_ascii=False, indent=2)
+    print(f"🧵 {len(stories)} historias con ≥2 artículos → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark de parseo por periódico: html.parser vs lxml vs lxml + SoupStrainer.
+
+Mide, para la portada y para el primer artículo de cada periódico, el tiempo
+de construcción del árbol (mejor de N repeticiones) y el pico de memoria
+(tracemalloc). Comprueba además que el parser de lista encuentra los mismos
+artículos con cada variante.
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.bench_parsing               # descarga las páginas
+    python -m Benchmarks.bench_parsing --html-dir d  # usa d/<dominio>.html y d/<dominio>_article.html
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+from scraper_cron import SCRAPERS, URLS
+
+
+def measure(build, repeat):
+    """Devuelve (mejor tiempo en ms, pico de memoria en KB, resultado)."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = build()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024, result
+
+
+def load_pages(domain, scraper, html_dir):
+    """HTML de portada y de un artículo (disco o red)."""
+    if html_dir:
+        pages = []
+        for suffix in ('', '_article'):
+            path = os.path.join(html_dir, f'{domain}{suffix}.html')
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    pages.append(f.read().decode('utf-8', errors='replace'))
+            else:
+                pages.append(None)
+        return pages
+
+    url = URLS.get(domain, f'https://www.{domain}')
+    home = scraper.fetch(url).text
+    urls = scraper.collect_detail_urls(scraper.build_soup(home, 'list'), url)
+    article = scraper.fetch(urls[0]).text if urls else None
+    return [home, article]
+
+
+def count_cards(scraper, soup, url):
+    return len([a for a in scraper._run_list_parser(soup, url, lambda u: {}) if a.get('url')])
+
+
+def bench_domain(domain, scraper, html_dir, repeat):
+    home, article = load_pages(domain, scraper, html_dir)
+    url = URLS.get(domain, f'https://www.{domain}')
+    rows = []
+    if home:
+        variants = [
+            ('html.parser', lambda: scraper.build_soup(home, backend='html.parser')),
+            ('lxml', lambda: scraper.build_soup(home, backend='lxml')),
+            ('lxml+strainer', lambda: scraper.build_soup(home, 'list', backend='lxml')),
+        ]
+        for label, build in variants:
+            ms, kb, soup = measure(build, repeat)
+            rows.append(('portada', label, ms, kb, count_cards(scraper, soup, url)))
+    if article:
+        variants = [
+            ('html.parser', lambda: scraper.build_soup(article, backend='html.parser')),
+            ('lxml', lambda: scraper.build_soup(article, backend='lxml')),
+            ('lxml+strainer', lambda: scraper.build_soup(article, 'detail', backend='lxml')),
+        ]
+        for label, build in variants:
+            ms, kb, _ = measure(build, repeat)
+            rows.append(('artículo', label, ms, kb, None))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--html-dir', default=None, help='Directorio con HTML guardado')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--domain', action='append', help='Limitar a uno o varios dominios')
+    args = parser.parse_args()
+
+    print(f"{'periódico':<20}{'página':<10}{'variante':<16}{'ms':>9}{'KB pico':>11}{'Δms':>9}{'ΔKB':>10}{'tarjetas':>10}")
+    for domain, scraper in SCRAPERS.items():
+        if args.domain and domain not in args.domain:
+            continue
+        try:
+            rows = bench_domain(domain, scraper, args.html_dir, args.repeat)
+        except Exception as e:
+            print(f"{domain:<20}❌ {str(e)[:80]}")
+            continue
+        baseline = {}
+        for page, label, ms, kb, cards in rows:
+            base_ms, base_kb = baseline.setdefault(page, (ms, kb))
+            print(f"{domain:<20}{page:<10}{label:<16}{ms:>9.1f}{kb:>11.0f}"
+                  f"{ms - base_ms:>+9.1f}{kb - base_kb:>+10.0f}{'' if cards is None else cards:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Un único Chromium headless compartido por todas las fuentes de una ejecución.
+
+Arrancar Chromium cuesta segundos y cientos de MB; abrir un contexto o una
+página sobre un navegador ya arrancado cuesta milisegundos. `BrowserPool`
+lanza el navegador una vez, reutiliza un contexto por combinación de opciones
+(user agent, viewport...) y entrega páginas nuevas que se cierran al salir,
+de modo que varias fuentes pueden cargarse a la vez en páginas distintas.
+"""
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+class BrowserPool:
+    """Navegador + contextos compartidos; usar como `async with BrowserPool() as pool`."""
+
+    def __init__(self, headless=True, max_pages=4):
+        self.headless = headless
+        self.max_pages = max_pages
+        self.startup_seconds = 0.0
+        self.pages_opened = 0
+        self._playwright = None
+        self._browser = None
+        self._contexts = {}
+        self._lock = asyncio.Lock()
+        self._page_sem = asyncio.Semaphore(max_pages)
+
+    async def __aenter__(self):
+        # Playwright no está en requirements.txt (lo instala el workflow de
+        # tendencias): se importa al arrancar para que las vías sin navegador
+        # (p. ej. trends24 por HTTP) se puedan importar y probar sin él
+        from playwright.async_api import async_playwright
+
+        started = time.perf_counter()
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self.startup_seconds = time.perf_counter() - started
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def context(self, **options):
+        """Contexto compartido para estas opciones (se crea la primera vez)."""
+        options.setdefault('user_agent', DEFAULT_USER_AGENT)
+        key = json.dumps(options, sort_keys=True)
+        async with self._lock:
+            context = self._contexts.get(key)
+            if context is None:
+                context = self._contexts[key] = await self._browser.new_context(**options)
+            return context
+
+    @asynccontextmanager
+    async def page(self, **options):
+        """Página nueva en el contexto de `options`; se cierra al salir del bloque."""
+        async with self._page_sem:
+            context = await self.context(**options)
+            page = await context.new_page()
+            self.pages_opened += 1
+            try:
+                yield page
+            finally:
+                await page.close()
+
+    async def close(self):
+        for context in self._contexts.values():
+            await context.close()
+        self._contexts.clear()
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
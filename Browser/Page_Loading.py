@@ -0,0 +1,149 @@
+"""Carga de páginas ligera: bloqueo de recursos por fuente y medición de la carga.
+
+Las fuentes de tendencias solo leen texto de unos pocos selectores, así que
+imágenes, fuentes, vídeo, analítica y scripts de terceros se pueden abortar
+con `page.route` sin cambiar el resultado. Cada fuente declara su
+`RequestPolicy` y su condición de "listo" (`LoadPlan`): la de `page.goto`
+(`domcontentloaded` por defecto) + el selector de las filas.
+
+`PageMeter` cuenta por CDP los bytes transferidos (`encodedDataLength`) y las
+peticiones de una página, para comparar cargas con y sin bloqueo.
+"""
+import time
+from urllib.parse import urlsplit
+
+# Tipos de recurso de Playwright que nunca aportan texto
+HEAVY_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Analítica, publicidad y trackers habituales (se comparan por sufijo de host)
+TRACKER_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'googletagservices.com',
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
+    'adservice.google.com', 'amazon-adsystem.com', 'facebook.net',
+    'scorecardresearch.com', 'quantserve.com', 'criteo.com', 'criteo.net',
+    'taboola.com', 'outbrain.com', 'hotjar.com', 'pubmatic.com',
+    'rubiconproject.com', 'adnxs.com', 'cloudflareinsights.com', 'clarity.ms',
+)
+
+
+def _host(url):
+    return (urlsplit(url).hostname or '').lower()
+
+
+def _matches(host, suffixes):
+    return any(host == s or host.endswith('.' + s) for s in suffixes)
+
+
+def _site(host):
+    """Dominio registrable aproximado (`www.trends24.in` -> `trends24.in`)."""
+    return '.'.join(host.split('.')[-2:])
+
+
+class RequestPolicy:
+    """Qué peticiones abortar en una página.
+
+    - `block_types`: tipos de recurso de Playwright (`image`, `font`, `media`...).
+    - `block_trackers`: hosts de `TRACKER_HOSTS`.
+    - `block_third_party_scripts`: scripts de otro sitio que no esté en `first_party`.
+    """
+
+    def __init__(self, block_types=HEAVY_RESOURCE_TYPES, block_trackers=True,
+                 block_third_party_scripts=False, first_party=()):
+        self.block_types = frozenset(block_types)
+        self.block_trackers = block_trackers
+        self.block_third_party_scripts = block_third_party_scripts
+        self.first_party = tuple(first_party)
+
+    @classmethod
+    def off(cls):
+        """Sin bloqueo (carga completa, como un navegador normal)."""
+        return cls(block_types=(), block_trackers=False)
+
+    @property
+    def enabled(self):
+        return bool(self.block_types or self.block_trackers or self.block_third_party_scripts)
+
+    def should_block(self, request, page_url):
+        if request.resource_type in self.block_types:
+            return True
+        host = _host(request.url)
+        if self.block_trackers and _matches(host, TRACKER_HOSTS):
+            return True
+        if self.block_third_party_scripts and request.resource_type == 'script':
+            first_party = self.first_party + (_site(_host(page_url)),)
+            return not _matches(host, first_party)
+        return False
+
+    async def install(self, page, page_url, meter=None):
+        """Activa la política en `page`, que cargará `page_url` (no hace nada si está desactivada)."""
+        if not self.enabled:
+            return
+
+        async def handle(route):
+            if self.should_block(route.request, page_url):
+                if meter is not None:
+                    meter.blocked += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await page.route('**/*', handle)
+
+
+class LoadPlan:
+    """Cómo cargar una fuente: política de peticiones + condición de "listo"."""
+
+    def __init__(self, policy, wait_until='domcontentloaded'):
+        self.policy = policy
+        self.wait_until = wait_until
+
+    def without_blocking(self):
+        """El mismo plan sin bloqueo (solo cambia la política, no `wait_until`)."""
+        return LoadPlan(RequestPolicy.off(), wait_until=self.wait_until)
+
+    async def open(self, page, url, ready_selector, timeout=45000, meter=None):
+        """Navega a `url` y espera `ready_selector`; devuelve los segundos hasta el selector."""
+        await self.policy.install(page, url, meter)
+        started = time.perf_counter()
+        await page.goto(url, wait_until=self.wait_until, timeout=timeout)
+        await page.wait_for_selector(ready_selector, timeout=30000)
+        elapsed = time.perf_counter() - started
+        if meter is not None:
+            meter.time_to_selector = elapsed
+        return elapsed
+
+
+class PageMeter:
+    """Bytes transferidos y peticiones de una página, vía CDP (solo Chromium)."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.requests = 0
+        self.blocked = 0
+        self.time_to_selector = None
+        self._session = None
+
+    def _on_finished(self, event):
+        self.requests += 1
+        self.bytes += int(event.get('encodedDataLength') or 0)
+
+    async def attach(self, page):
+        """Empieza a contar en `page`, con la caché HTTP desactivada (cargas en frío comparables)."""
+        self._session = await page.context.new_cdp_session(page)
+        self._session.on('Network.loadingFinished', self._on_finished)
+        await self._session.send('Network.enable')
+        await self._session.send('Network.setCacheDisabled', {'cacheDisabled': True})
+        return self
+
+    async def detach(self):
+        if self._session is not None:
+            await self._session.detach()
+            self._session = None
+
+    def as_dict(self):
+        return {
+            'kb': round(self.bytes / 1024, 1),
+            'requests': self.requests,
+            'blocked': self.blocked,
+            'time_to_selector': round(self.time_to_selector, 2) if self.time_to_selector is not None else None,
+        }
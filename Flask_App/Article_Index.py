@@ -0,0 +1,205 @@
+"""Índices en memoria sobre el histórico de 7 días para servir `/articles`.
+
+Los artículos se cargan una vez (del JSON de `scraper_cron.py` o de un
+almacén de `Storage`) ordenados por `(scraped_at, id)` de mayor a menor; cada
+artículo se identifica por su posición en ese orden. Los índices por dominio, tag y
+autor son listas ordenadas de posiciones, y el rango de fechas (`scraped_at`)
+es un tramo contiguo de posiciones que se localiza con bisección. El índice se
+reconstruye cuando cambian los ficheros vigilados (mtime/tamaño).
+
+La paginación usa un cursor opaco con `(scraped_at, id)` del último artículo
+devuelto. Como ese par ordena totalmente el índice, el cursor es estable aunque
+el índice se recargue entre página y página, incluso si su artículo ya no está
+(se sigue por la siguiente clave).
+"""
+import base64
+import bisect
+import json
+import os
+import re
+import threading
+import time
+
+from Utils.Text_Utils import TextUtils
+
+_AUTHOR_SPLIT = re.compile(r',|\s+y\s+|\s*/\s*')
+
+
+def _norm(value):
+    return TextUtils.cleantext(value).lower()
+
+
+def _key(article):
+    """Clave de orden y de cursor: `(scraped_at, id)`."""
+    return (article.get('scraped_at') or '', str(article.get('id') or ''))
+
+
+def encode_cursor(article):
+    raw = json.dumps(list(_key(article)))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    padded = cursor + '=' * (-len(cursor) % 4)
+    scraped_at, article_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    return scraped_at, str(article_id)
+
+
+class _Snapshot:
+    """Artículos + índices construidos de una vez (inmutable)."""
+
+    def __init__(self, articles):
+        # Orden total por (scraped_at, id), de mayor a menor: en una ejecución
+        # todos los artículos comparten scraped_at y el id desempata
+        self.articles = sorted(articles, key=_key, reverse=True)
+        # Claves y fechas en orden ascendente (posición n-1 primero) para bisect
+        self.keys_asc = [_key(a) for a in reversed(self.articles)]
+        self.dates_asc = [scraped_at for scraped_at, _ in self.keys_asc]
+        self.by_domain = {}
+        self.by_tag = {}
+        self.by_author = {}
+        for position, art in enumerate(self.articles):
+            self.by_domain.setdefault((art.get('domain') or '').lower(), []).append(position)
+            for tag in {_norm(t) for t in art.get('tags') or [] if t}:
+                self.by_tag.setdefault(tag, []).append(position)
+            for name in {_norm(n) for n in _AUTHOR_SPLIT.split(str(art.get('author') or '')) if n.strip()}:
+                self.by_author.setdefault(name, []).append(position)
+        # Las mismas posiciones como conjuntos, para comprobar los filtros que no guían el recorrido
+        self.sets = {
+            index_name: {value: frozenset(positions) for value, positions in index.items()}
+            for index_name, index in (('domain', self.by_domain), ('tag', self.by_tag),
+                                      ('author', self.by_author))
+        }
+
+    def date_range(self, since=None, until=None):
+        """Tramo `[start, end)` de posiciones con `since <= scraped_at <= until`."""
+        n = len(self.articles)
+        start = n - bisect.bisect_right(self.dates_asc, until) if until else 0
+        end = n - bisect.bisect_left(self.dates_asc, since) if since else n
+        return start, end
+
+    def position_after(self, cursor):
+        """Primera posición con clave menor que `(scraped_at, id)` del cursor.
+
+        Si el artículo del cursor ya no está en el índice se sigue por la
+        siguiente clave, sin saltarse los de su mismo `scraped_at`.
+        """
+        return len(self.articles) - bisect.bisect_left(self.keys_asc, tuple(cursor))
+
+
+class ArticleIndex:
+    """Índice recargable sobre los artículos que devuelve `load()` (en cualquier orden)."""
+
+    MAX_LIMIT = 200
+
+    def __init__(self, load, watch_paths, check_interval=1.0):
+        self._load = load
+        self.watch_paths = list(watch_paths)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._signature = None
+        self._checked_at = 0.0
+        self.reloads = 0
+        self.load_ms = 0.0
+
+    @classmethod
+    def from_json(cls, path):
+        def load():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return []
+        return cls(load, [path])
+
+    @classmethod
+    def from_store(cls, open_store, watch_paths):
+        """`open_store()` abre el almacén en cada recarga (el manifest de segmentos
+        o la conexión SQLite se leen de nuevo)."""
+        def load():
+            store = open_store()
+            try:
+                return list(store.iter_recent())
+            finally:
+                if hasattr(store, 'close'):
+                    store.close()
+        return cls(load, watch_paths)
+
+    def _current_signature(self):
+        signature = []
+        for path in self.watch_paths:
+            try:
+                st = os.stat(path)
+                signature.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    def snapshot(self):
+        """Snapshot vigente; lo reconstruye si los ficheros cambiaron (como mucho cada `check_interval`)."""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._checked_at < self.check_interval:
+            return self._snapshot
+        with self._lock:
+            if self._snapshot is not None and now - self._checked_at < self.check_interval:
+                return self._snapshot
+            signature = self._current_signature()
+            if signature != self._signature or self._snapshot is None:
+                started = time.perf_counter()
+                self._snapshot = _Snapshot(self._load())
+                self.load_ms = (time.perf_counter() - started) * 1000
+                self._signature = signature
+                self.reloads += 1
+            self._checked_at = now
+            return self._snapshot
+
+    def query(self, domain=None, tag=None, author=None, since=None, until=None,
+              cursor=None, limit=50, dedup=False):
+        """Página de artículos filtrados → `(artículos, next_cursor)`."""
+        snap = self.snapshot()
+        limit = max(1, min(int(limit), self.MAX_LIMIT))
+        if until and len(until) == 10:
+            until += 'T23:59:59.999999'  # fecha sin hora: día completo
+
+        start, end = snap.date_range(since, until)
+        if cursor:
+            start = max(start, snap.position_after(decode_cursor(cursor)))
+
+        # Índices de los filtros pedidos; se recorre el más corto y se comprueba el resto
+        postings = []
+        for name, index, value in (('domain', snap.by_domain, domain and domain.lower()),
+                                   ('tag', snap.by_tag, tag and _norm(tag)),
+                                   ('author', snap.by_author, author and _norm(author))):
+            if value:
+                postings.append((index.get(value, []), snap.sets[name].get(value, frozenset())))
+        if postings:
+            postings.sort(key=lambda posting: len(posting[0]))
+            driver, others = postings[0][0], [positions for _, positions in postings[1:]]
+            candidates = (p for p in driver[bisect.bisect_left(driver, start):]
+                          if all(p in o for o in others))
+        else:
+            candidates = iter(range(start, end))
+
+        page = []
+        for position in candidates:
+            if position >= end:
+                break
+            art = snap.articles[position]
+            if dedup and art.get('duplicate_of'):
+                continue
+            if len(page) == limit:
+                return page, encode_cursor(page[-1])
+            page.append(art)
+        return page, None
+
+    def stats(self):
+        snap = self._snapshot
+        return {
+            'articles': len(snap.articles) if snap else 0,
+            'domains': len(snap.by_domain) if snap else 0,
+            'tags': len(snap.by_tag) if snap else 0,
+            'authors': len(snap.by_author) if snap else 0,
+            'reloads': self.reloads,
+            'load_ms': round(self.load_ms, 1),
+        }
@@ -1,5 +1,8 @@
 from flask import Flask, jsonify, request
 
+from Flask_App.Response_Cache import ResponseCache
+from Flask_App.Single_Flight import SingleFlight
+
 class NewsFlaskApp:
     """Flask app reutilizable para cualquier scraper."""
     
@@ -9,7 +12,48 @@ class NewsFlaskApp:
         self.port = port
         self.domains = domains or [name.lower().replace(' ', '').replace('.', '')]
         self.app = Flask(__name__)
+        self.flights = SingleFlight()
         self._register_routes()
+
+    def run_scrape(self, url):
+        """Portada + `enrich_article` de cada artículo (o detalle directo) → `(payload, estado)`."""
+        avoided = self.scraper.stats.get('duplicate_fetches_avoided', 0)
+        with self.scraper.run_scope():
+            results = self.scraper.scrape_list_page(url)
+
+            # Si no hay resultados (posible URL de artículo), intentar obtener detalles directos
+            if not results:
+                try:
+                    details = self.scraper.scrape_article_details(url)
+                    # Crear id determinístico a partir de la URL del artículo (MD5 + base62)
+                    date_str = self.scraper.date.normalizedatetime()
+                    article_id = self.scraper.idgen.generate_id_from_url(url)
+                    ordered = self.scraper.article.create_ordered_article(
+                        self.name,
+                        article_id,
+                        date_str,
+                        details.get('tags', []),
+                        details.get('title', ''),
+                        details.get('subtitle', ''),
+                        url,
+                        details.get('author', 'Redacción'),
+                        details.get('image', {'url': '', 'credits': ''}),
+                        details.get('body', '')
+                    )
+                    return [ordered], 200
+                except Exception as e:
+                    return {'error': 'No se encontraron artículos y falló extracción de detalle', 'message': str(e)}, 500
+
+            # Enriquecer cada artículo llamando a `enrich_article` (siempre)
+            enriched = []
+            for art in results:
+                try:
+                    enriched.append(self.scraper.enrich_article(art))
+                except Exception:
+                    enriched.append(art)
+        avoided = self.scraper.stats.get('duplicate_fetches_avoided', 0) - avoided
+        print(f"♻️ {avoided} descargas duplicadas evitadas")
+        return enriched, 200
     
     def _register_routes(self):
         @self.app.route('/scrape', methods=['GET'])
@@ -20,39 +64,10 @@ class NewsFlaskApp:
 
             for domain in self.domains:
                 if domain in url.lower():
-                    results = self.scraper.scrape_list_page(url)
-
-                    # Si no hay resultados (posible URL de artículo), intentar obtener detalles directos
-                    if not results:
-                        try:
-                            details = self.scraper.fetch_article_details(url)
-                            # Crear id determinístico a partir de la URL del artículo (MD5 + base62)
-                            date_str = self.scraper.date.normalizedatetime()
-                            article_id = self.scraper.idgen.generate_id_from_url(url)
-                            ordered = self.scraper.article.create_ordered_article(
-                                self.name,
-                                article_id,
-                                date_str,
-                                details.get('tags', []),
-                                details.get('title', ''),
-                                details.get('subtitle', ''),
-                                url,
-                                details.get('author', 'Redacción'),
-                                details.get('image', {'url': '', 'credits': ''}),
-                                details.get('body', '')
-                            )
-                            return jsonify([ordered])
-                        except Exception as e:
-                            return jsonify({'error': 'No se encontraron artículos y falló extracción de detalle', 'message': str(e)}), 500
-
-                    # Enriquecer cada artículo llamando a `enrich_article` (siempre)
-                    enriched = []
-                    for art in results:
-                        try:
-                            enriched.append(self.scraper.enrich_article(art))
-                        except Exception:
-                            enriched.append(art)
-                    return jsonify(enriched)
+                    # Peticiones simultáneas a la misma URL comparten un único scrape
+                    (payload, status), _ = self.flights.do(ResponseCache.normalize(url),
+                                                           lambda: self.run_scrape(url))
+                    return jsonify(payload), status
 
             return jsonify({
                 'error': f'Requiere url {self.name}', 
@@ -67,7 +82,8 @@ class NewsFlaskApp:
                 'status': 'OK',
                 'scraper': self.name,
                 'domains': self.domains,
-                'port': self.port
+                'port': self.port,
+                'single_flight': self.flights.stats()
             })
     
     def run(self, debug=True, host='127.0.0.1'):
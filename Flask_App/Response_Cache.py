@@ -0,0 +1,128 @@
+"""Caché en memoria de respuestas de `/scrape`, por URL normalizada.
+
+- TTL por dominio; pasado el TTL la respuesta se sigue sirviendo ("stale")
+  durante `stale_ttl` segundos mientras un hilo en segundo plano la refresca.
+- Presupuesto de memoria en bytes (cuerpos JSON ya serializados) con expulsión LRU.
+- Solo se cachean respuestas 200.
+"""
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Parámetros de seguimiento que no cambian la página
+_TRACKING_PREFIXES = ('utm_', 'mc_')
+_TRACKING_PARAMS = frozenset(('fbclid', 'gclid', 'ref'))
+
+
+class ResponseCache:
+    """Caché LRU de respuestas serializadas con stale-while-revalidate."""
+
+    def __init__(self, default_ttl=300, ttls=None, stale_ttl=3600, max_bytes=64 * 1024 * 1024):
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})  # dominio -> TTL en segundos
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # clave -> (cuerpo, estado, guardado_en), del menos al más usado
+        self._total_bytes = 0
+        self._refreshing = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize(url):
+        """Clave de caché: esquema/host en minúsculas, sin fragmento, puerto por
+        defecto, barra final ni parámetros de seguimiento; query ordenada."""
+        parts = urlsplit(url.strip())
+        scheme = (parts.scheme or 'https').lower()
+        host = (parts.hostname or '').lower()
+        if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+            host = f'{host}:{parts.port}'
+        path = parts.path.rstrip('/') or '/'
+        query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not k.lower().startswith(_TRACKING_PREFIXES) and k.lower() not in _TRACKING_PARAMS)
+        return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+    def ttl_for(self, domain):
+        return self.ttls.get(domain, self.default_ttl)
+
+    def fetch(self, key, compute, domain=None):
+        """Devuelve `(cuerpo, estado, edad, 'HIT'|'STALE'|'MISS')`.
+
+        `compute()` devuelve `(cuerpo, estado)`; se llama en línea si no hay
+        entrada utilizable y en segundo plano si la entrada está caducada
+        pero dentro de `stale_ttl`.
+        """
+        ttl = self.ttl_for(domain)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                body, status, stored_at = entry
+                age = time.time() - stored_at
+                if age < ttl:
+                    self.hits += 1
+                    return body, status, age, 'HIT'
+                if age < ttl + self.stale_ttl:
+                    self.stale_hits += 1
+                    refresh = key not in self._refreshing
+                    if refresh:
+                        self._refreshing.add(key)
+                else:
+                    entry = None
+            if entry is None:
+                self.misses += 1
+        if entry is not None:
+            if refresh:
+                threading.Thread(target=self._refresh, args=(key, compute), daemon=True).start()
+            return body, status, age, 'STALE'
+
+        body, status = compute()
+        self.store(key, body, status)
+        return body, status, 0.0, 'MISS'
+
+    def _refresh(self, key, compute):
+        try:
+            body, status = compute()
+            self.store(key, body, status)
+            with self._lock:
+                self.refreshes += 1
+        except Exception as e:
+            with self._lock:
+                self.refresh_errors += 1
+            print(f"⚠️ Refresco en segundo plano de {key} falló: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def store(self, key, body, status):
+        if status != 200 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= len(old[0])
+            self._entries[key] = (body, status, time.time())
+            self._total_bytes += len(body)
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'evictions': self.evictions,
+            }
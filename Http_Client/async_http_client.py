@@ -0,0 +1,77 @@
+"""Contraparte asyncio de `NewsHTTPClient`.
+
+Las peticiones se ejecutan sobre el `NewsHTTPClient` compartido (mismo pool
+keep-alive y rotación de User-Agent) en un executor de hilos, limitadas por
+dos semáforos: uno global y otro por dominio. Así el bucle de eventos nunca
+se bloquea y cada periódico recibe como mucho `per_domain_limit` peticiones
+simultáneas. El ritmo por host lo marca `HostRateLimiter.acquire_async`.
+"""
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from .http_client import NewsHTTPClient
+from .session_pool import SessionPool
+
+
+class AsyncNewsHTTPClient:
+    """Cliente HTTP asíncrono con concurrencia acotada global y por dominio."""
+
+    def __init__(self, http=None, global_limit=16, per_domain_limit=4):
+        self.http = http or NewsHTTPClient.shared()
+        self.global_limit = global_limit
+        self.per_domain_limit = per_domain_limit
+        self._executor = ThreadPoolExecutor(max_workers=global_limit,
+                                            thread_name_prefix='news-http')
+        # Los semáforos se crean perezosamente dentro del bucle de eventos activo
+        self._global_sem = None
+        self._domain_sems = {}
+
+    @staticmethod
+    def domain_of(url):
+        """Dominio registrable aproximado (`www.abc.es` -> `abc.es`)."""
+        host = SessionPool.host_of(url)
+        return host[4:] if host.startswith('www.') else host
+
+    def _semaphores(self, url):
+        if self._global_sem is None:
+            self._global_sem = asyncio.Semaphore(self.global_limit)
+        domain = self.domain_of(url)
+        sem = self._domain_sems.get(domain)
+        if sem is None:
+            sem = self._domain_sems[domain] = asyncio.Semaphore(self.per_domain_limit)
+        return self._global_sem, sem
+
+    async def run(self, url, func, *args, rate_limited=True):
+        """Ejecuta `func(*args)` en el executor respetando los límites del dominio de `url`.
+
+        Permite acotar no solo la GET sino también el parseo posterior
+        (p. ej. `scraper.scrape_article_details(url)`). Con `rate_limited=False`
+        no se reserva turno del limitador: para trabajo que no sale a la red
+        (p. ej. parsear una respuesta vigente de la caché en disco).
+        """
+        global_sem, domain_sem = self._semaphores(url)
+        limiter = self.http.limiter
+
+        def call():
+            if not rate_limited:
+                return func(*args)
+            # El turno ya se reservó sin bloquear: la GET del hilo no vuelve a esperar
+            with limiter.prepaid():
+                return func(*args)
+
+        async with domain_sem:
+            if rate_limited:
+                await limiter.acquire_async(url)
+            async with global_sem:
+                loop = asyncio.get_running_loop()
+                # El hilo hereda el contexto de la tarea (p. ej. el memo de `run_scope`)
+                context = contextvars.copy_context()
+                return await loop.run_in_executor(self._executor, context.run, call)
+
+    async def get(self, url, **kwargs):
+        """GET asíncrona; mismos argumentos que `NewsHTTPClient.get`."""
+        return await self.run(url, lambda: self.http.get(url, **kwargs))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
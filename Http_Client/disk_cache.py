@@ -0,0 +1,215 @@
+"""Caché HTTP persistente en disco, indexada por URL.
+
+- Cuerpos comprimidos con gzip (`<sha1>.gz`) y un índice `index.json` con los
+  metadatos (estado, cabeceras útiles, tamaño, fechas).
+- TTL por dominio y tipo de página: portadas con TTL corto, artículos largo.
+- Presupuesto de bytes (comprimidos) con expulsión LRU.
+- Estadísticas de aciertos/fallos.
+
+El directorio se puede conservar entre ejecuciones (p. ej. `actions/cache`).
+"""
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .session_pool import SessionPool
+
+# Cabeceras que se guardan junto al cuerpo
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Date')
+
+
+class DiskCache:
+    """Caché de respuestas HTTP en disco con TTL y expulsión LRU."""
+
+    def __init__(self, directory, max_bytes=200 * 1024 * 1024,
+                 home_ttl=15 * 60, article_ttl=3 * 24 * 3600, ttls=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.home_ttl = home_ttl
+        self.article_ttl = article_ttl
+        self.ttls = dict(ttls or {})  # dominio -> (home_ttl, article_ttl)
+        self._index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # url -> metadatos, del menos al más usado
+        self._total_bytes = 0
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stores = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+        atexit.register(self.flush)
+
+    # ── índice ──────────────────────────────────────────────
+
+    def _load(self):
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = []
+        for entry in sorted(entries, key=lambda e: e.get('accessed_at', 0)):
+            if os.path.exists(self._body_path(entry['key'])):
+                self._index[entry['url']] = entry
+                self._total_bytes += entry.get('size', 0)
+
+    def flush(self):
+        """Escribe el índice a disco (atómico)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = list(self._index.values())
+            self._dirty = False
+        tmp = self._index_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp, self._index_path)
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, key + '.gz')
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    # ── política ────────────────────────────────────────────
+
+    def ttl_for(self, url):
+        """TTL en segundos: portada (`/`) corto, resto de páginas largo."""
+        host = SessionPool.host_of(url)
+        home_ttl, article_ttl = self.home_ttl, self.article_ttl
+        for domain, (d_home, d_article) in self.ttls.items():
+            if host == domain or host.endswith('.' + domain):
+                home_ttl, article_ttl = d_home, d_article
+                break
+        path = urlparse(url).path
+        return home_ttl if path in ('', '/') else article_ttl
+
+    def _evict(self):
+        """Expulsa entradas LRU hasta cumplir el presupuesto. Requiere `_lock`."""
+        while self._total_bytes > self.max_bytes and self._index:
+            url, entry = self._index.popitem(last=False)
+            self._total_bytes -= entry.get('size', 0)
+            self.evictions += 1
+            try:
+                os.remove(self._body_path(entry['key']))
+            except OSError:
+                pass
+
+    # ── API ─────────────────────────────────────────────────
+
+    def lookup(self, url):
+        """Devuelve `(entry, fresh)` o `(None, False)` si la URL no está en caché."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None, False
+            fresh = time.time() - entry['stored_at'] < self.ttl_for(url)
+            return dict(entry), fresh
+
+    def get(self, url):
+        """Respuesta cacheada si existe y no ha caducado; si no, `None`."""
+        entry, fresh = self.lookup(url)
+        if entry is None or not fresh:
+            with self._lock:
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self.expired += 1
+            return None
+        resp = self.load_response(entry)
+        with self._lock:
+            if resp is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return resp
+
+    def load_response(self, entry):
+        """Reconstruye un `requests.Response` a partir de una entrada del índice."""
+        try:
+            with gzip.open(self._body_path(entry['key']), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        with self._lock:
+            if entry['url'] in self._index:
+                self._index[entry['url']]['accessed_at'] = time.time()
+                self._index.move_to_end(entry['url'])
+                self._dirty = True
+
+        resp = requests.Response()
+        resp._content = content
+        resp.status_code = entry.get('status', 200)
+        resp.reason = 'OK'
+        resp.headers = CaseInsensitiveDict(entry.get('headers') or {})
+        resp.url = entry.get('final_url') or entry['url']
+        resp.encoding = entry.get('encoding')
+        resp.from_cache = True
+        return resp
+
+    def refresh(self, url):
+        """Reinicia el TTL de `url` (p. ej. tras una revalidación 304)."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is not None:
+                entry['stored_at'] = time.time()
+                self._dirty = True
+
+    def store(self, url, resp):
+        """Guarda una respuesta 200 en caché."""
+        if resp.status_code != 200:
+            return
+        key = self._key(url)
+        data = gzip.compress(resp.content, compresslevel=6)
+        tmp = self._body_path(key) + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self._body_path(key))
+
+        now = time.time()
+        entry = {
+            'url': url,
+            'key': key,
+            'final_url': resp.url,
+            'status': resp.status_code,
+            'encoding': resp.encoding,
+            'headers': {h: resp.headers[h] for h in _KEPT_HEADERS if h in resp.headers},
+            'size': len(data),
+            'stored_at': now,
+            'accessed_at': now,
+        }
+        with self._lock:
+            old = self._index.pop(url, None)
+            if old:
+                self._total_bytes -= old.get('size', 0)
+            self._index[url] = entry
+            self._total_bytes += entry['size']
+            self.stores += 1
+            self._dirty = True
+            self._evict()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.expired
+            return {
+                'entries': len(self._index),
+                'bytes': self._total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -1,20 +1,86 @@
-import requests
-from random import uniform
+import os
+import threading
 import time
 
+from .disk_cache import DiskCache
+from .rate_limiter import HostRateLimiter
+from .session_pool import SessionPool
 from .user_agents import get_random_user_agent, mutate_user_agent_prefix
+from .validator_store import ValidatorStore
 
 
 class NewsHTTPClient:
-    """Cliente HTTP simple para las peticiones de scraping."""
+    """Cliente HTTP simple para las peticiones de scraping.
 
-    def __init__(self, timeout=15, delay=0.5):
+    Las peticiones pasan por un `SessionPool` (una sesión keep-alive por host),
+    de modo que varias páginas del mismo periódico comparten conexión TCP/TLS,
+    y por un `HostRateLimiter` que espacia solo las peticiones al mismo host.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, timeout=15, delay=0.5, pool_connections=2, pool_maxsize=4, idle_timeout=90.0):
         self.timeout = timeout
-        self.delay = delay  # Máximo 0.5s, pero usamos random(0, 0.5)
+        self.delay = delay  # Intervalo medio por host: 0.5s -> 2 peticiones/s
+        self.pool = SessionPool(pool_connections=pool_connections,
+                                pool_maxsize=pool_maxsize,
+                                idle_timeout=idle_timeout)
+        self.limiter = HostRateLimiter(default_rate=(1.0 / delay) if delay else None)
+        self.cache = None  # DiskCache opcional, ver `enable_cache`
+        self.validators = ValidatorStore()  # ETag / Last-Modified por URL
+        # Los contadores se actualizan desde los hilos del modo paralelo y del async
+        self._stats_lock = threading.Lock()
+        self._conditional_sent = 0
+        self._not_modified = 0
+
+    @classmethod
+    def shared(cls):
+        """Instancia común a todos los scrapers (comparten el pool de sesiones)."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def enable_cache(self, directory, **kwargs):
+        """Activa la caché en disco (opt-in). `kwargs` se pasan a `DiskCache`.
+
+        Los validadores condicionales se persisten en el mismo directorio.
+        """
+        self.cache = DiskCache(directory, **kwargs)
+        self.validators = ValidatorStore(os.path.join(directory, 'validators.json'))
+        return self.cache
+
+    def is_cached(self, url):
+        """¿Hay una respuesta vigente en la caché en disco? (no toca la red)"""
+        return self.cache is not None and self.cache.lookup(url)[1]
+
+    def get(self, url, headers=None, ua_category: str = None,
+            mutate_ua_prefix: bool = False, allow_bots: bool = False,
+            use_cache: bool = True, conditional: bool = False, deadline: float = None, **kwargs):
+        """Realiza una GET con rotación de User-Agent.
+
+        Si la caché en disco está activa (y `use_cache`), una entrada vigente
+        se devuelve sin tocar la red (`resp.from_cache = True`).
 
-    def get(self, url, headers=None, ua_category: str = None, 
-            mutate_ua_prefix: bool = False, allow_bots: bool = False, **kwargs):
-        """Realiza una GET con rotación de User-Agent."""
+        Revalidación condicional: si hay un cuerpo caducado en caché, o el
+        llamante pasa `conditional=True` porque conserva datos derivados de la
+        última respuesta, se envían `If-None-Match` / `If-Modified-Since`.
+        Ante un 304 la respuesta lleva `resp.not_modified = True` (con el cuerpo
+        cacheado si existe; vacío en caso contrario).
+
+        `deadline` (instante de `time.monotonic()`) acota la petición: el
+        timeout efectivo es `min(self.timeout, lo que queda de plazo)`, así que
+        una petición en vuelo no se come el plazo del llamante.
+        """
+        cache = self.cache if (use_cache and not kwargs) else None
+        stale_entry = None
+        if cache is not None:
+            cached = cache.get(url)
+            if cached is not None:
+                cached.not_modified = False
+                return cached
+            stale_entry, _ = cache.lookup(url)
 
         if headers is None:
             headers = {}
@@ -30,7 +96,57 @@ class NewsHTTPClient:
                 ua = mutate_user_agent_prefix(ua)
             headers['User-Agent'] = ua
 
-        # 🎯 Delay ALEATORIO entre 0 y 0.5 segundos
-        time.sleep(uniform(0, 0.5))
+        if stale_entry is not None or conditional:
+            validator_headers = self.validators.conditional_headers(url)
+            if validator_headers:
+                headers.update(validator_headers)
+                with self._stats_lock:
+                    self._conditional_sent += 1
+
+        # 🎯 Cortesía por host (token bucket): no bloquea peticiones a otros periódicos
+        self.limiter.acquire(url)
+
+        timeout = self.timeout
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"plazo agotado antes de {url}")
+            timeout = min(timeout, remaining)
+
+        session = self.pool.get_session(url)
+        resp = session.get(url, headers=headers, timeout=timeout, **kwargs)
+        resp.from_cache = False
+        resp.not_modified = False
+
+        if resp.status_code == 304:
+            with self._stats_lock:
+                self._not_modified += 1
+            self.validators.touch(url)
+            if stale_entry is not None:
+                cache.refresh(url)
+                cached = cache.load_response(stale_entry)
+                if cached is not None:
+                    cached.not_modified = True
+                    return cached
+            resp.not_modified = True
+            return resp
+
+        if resp.status_code == 200:
+            self.validators.update_from_response(url, resp)
+            if cache is not None:
+                cache.store(url, resp)
+        return resp
+
+    def stats(self):
+        """Contadores de reutilización de conexiones y de revalidación condicional."""
+        stats = self.pool.stats()
+        with self._stats_lock:
+            stats['conditional_sent'] = self._conditional_sent
+            stats['not_modified'] = self._not_modified
+        return stats
 
-        return requests.get(url, headers=headers, timeout=self.timeout, **kwargs)
+    def close(self):
+        self.pool.close()
+        if self.cache is not None:
+            self.cache.flush()
+        self.validators.flush()
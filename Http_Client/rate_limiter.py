@@ -0,0 +1,113 @@
+"""Limitador de ritmo token-bucket por host.
+
+Sustituye a los `time.sleep` globales: solo espera la petición que va al
+mismo host que otra reciente, de modo que la cortesía con un periódico no
+retrasa las descargas de los demás. Sirve tanto para llamadas desde hilos
+(`acquire`) como desde asyncio (`acquire_async`).
+"""
+import asyncio
+import contextlib
+import threading
+import time
+
+from .session_pool import SessionPool
+
+
+class TokenBucket:
+    """Bucket con `rate` tokens/segundo y capacidad `burst`.
+
+    `reserve()` consume un token aunque no esté disponible todavía y devuelve
+    cuántos segundos hay que esperar hasta que lo esté (reserva), de modo que
+    varios llamantes concurrentes quedan escalonados sin volver a competir.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(float(burst), 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    """Un `TokenBucket` por dominio configurado (o por host si no hay configuración)."""
+
+    def __init__(self, default_rate=2.0, default_burst=2):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._limits = {}   # dominio -> (rate, burst)
+        self._buckets = {}  # clave (dominio u host) -> TokenBucket
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.waited = {}    # clave -> segundos esperados acumulados
+
+    def configure(self, domain, rate, burst=1):
+        """Fija el ritmo de `domain` y sus subdominios (`abc.es` cubre `www.abc.es`)."""
+        domain = domain.lower()
+        with self._lock:
+            self._limits[domain] = (rate, burst)
+            self._buckets.pop(domain, None)
+
+    def _bucket(self, url):
+        host = SessionPool.host_of(url)
+        with self._lock:
+            key, limit = host, (self.default_rate, self.default_burst)
+            for domain, domain_limit in self._limits.items():
+                if host == domain or host.endswith('.' + domain):
+                    key, limit = domain, domain_limit
+                    break
+            rate, burst = limit
+            if not rate:
+                return key, None
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return key, bucket
+
+    def reserve(self, url):
+        """Reserva un turno para `url` y devuelve los segundos de espera necesarios."""
+        key, bucket = self._bucket(url)
+        if bucket is None:
+            return 0.0
+        delay = bucket.reserve()
+        if delay:
+            with self._lock:
+                self.waited[key] = self.waited.get(key, 0.0) + delay
+        return delay
+
+    def acquire(self, url):
+        """Versión bloqueante (hilos). Solo duerme el hilo que llama."""
+        prepaid = getattr(self._local, 'prepaid', 0)
+        if prepaid:
+            self._local.prepaid = prepaid - 1
+            return 0.0
+        delay = self.reserve(url)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url):
+        """Versión asyncio: espera sin bloquear el bucle de eventos."""
+        delay = self.reserve(url)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    @contextlib.contextmanager
+    def prepaid(self, count=1):
+        """Marca `count` turnos ya reservados (vía `acquire_async`) para el hilo actual."""
+        self._local.prepaid = count
+        try:
+            yield
+        finally:
+            self._local.prepaid = 0
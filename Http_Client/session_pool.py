@@ -0,0 +1,108 @@
+"""Pool de `requests.Session` keep-alive, una por host.
+
+Cada host (p. ej. `www.abc.es`) tiene su propia sesión con un `HTTPAdapter`
+dimensionado según `pool_maxsize`, de modo que las peticiones sucesivas al
+mismo periódico reutilizan la conexión TCP/TLS en lugar de repetir el handshake.
+Las sesiones que llevan más de `idle_timeout` segundos sin usarse se cierran.
+"""
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """Gestiona sesiones HTTP persistentes por host y cuenta la reutilización."""
+
+    def __init__(self, pool_connections=2, pool_maxsize=4, idle_timeout=90.0):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self._sessions = {}  # host -> [session, last_used]
+        self._lock = threading.Lock()
+        # Contadores acumulados (incluyen sesiones ya cerradas)
+        self._requests = 0
+        self._sessions_created = 0
+        self._sessions_evicted = 0
+        self._closed_connections = 0
+
+    @staticmethod
+    def host_of(url):
+        """Devuelve el host normalizado (minúsculas, sin credenciales) de una URL."""
+        return (urlparse(url).hostname or '').lower()
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def _count_connections(session):
+        """Suma las conexiones abiertas por urllib3 en todos los pools de la sesión."""
+        total = 0
+        # El mismo adapter está montado para http:// y https://: contarlo una vez
+        for adapter in {id(a): a for a in session.adapters.values()}.values():
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            if pools is None:
+                continue
+            for key in list(pools.keys()):
+                total += getattr(pools.get(key), 'num_connections', 0)
+        return total
+
+    def _evict_idle(self, now):
+        """Cierra sesiones inactivas. Debe llamarse con `_lock` adquirido."""
+        if not self.idle_timeout:
+            return
+        for host, (session, last_used) in list(self._sessions.items()):
+            if now - last_used > self.idle_timeout:
+                self._closed_connections += self._count_connections(session)
+                session.close()
+                del self._sessions[host]
+                self._sessions_evicted += 1
+
+    def get_session(self, url):
+        """Devuelve la sesión del host de `url`, creándola si no existe."""
+        host = self.host_of(url)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._sessions.get(host)
+            if entry is None:
+                entry = [self._new_session(), now]
+                self._sessions[host] = entry
+                self._sessions_created += 1
+            entry[1] = now
+            self._requests += 1
+            return entry[0]
+
+    def close(self):
+        """Cierra todas las sesiones abiertas."""
+        with self._lock:
+            for session, _ in self._sessions.values():
+                self._closed_connections += self._count_connections(session)
+                session.close()
+            self._sessions.clear()
+
+    def stats(self):
+        """Contadores de reutilización de conexiones.
+
+        - `requests`: peticiones servidas por el pool.
+        - `connections_opened`: conexiones TCP/TLS realmente abiertas (handshakes).
+        - `connections_reused`: peticiones que reutilizaron una conexión existente.
+        """
+        with self._lock:
+            opened = self._closed_connections + sum(
+                self._count_connections(s) for s, _ in self._sessions.values())
+            return {
+                'hosts': len(self._sessions),
+                'requests': self._requests,
+                'sessions_created': self._sessions_created,
+                'sessions_evicted': self._sessions_evicted,
+                'connections_opened': opened,
+                'connections_reused': max(self._requests - opened, 0),
+            }
@@ -0,0 +1,95 @@
+"""Validadores HTTP (ETag / Last-Modified) por URL.
+
+Cada registro guarda los validadores de la última respuesta 200 y, de forma
+opcional, los datos ya extraídos de ese cuerpo (`details`). Cuando el servidor
+responde 304 el llamante puede reutilizar esos datos sin volver a parsear.
+Si se indica `path`, el almacén se persiste en JSON entre ejecuciones.
+"""
+import atexit
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class ValidatorStore:
+    """Almacén LRU de validadores condicionales (+ datos derivados) por URL."""
+
+    def __init__(self, path=None, max_entries=5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._records = OrderedDict()  # url -> {'etag', 'last_modified', 'details'}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path:
+            self._load()
+            atexit.register(self.flush)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._records.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def flush(self):
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._records)
+            self._dirty = False
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def get(self, url):
+        with self._lock:
+            record = self._records.get(url)
+            return dict(record) if record else None
+
+    def conditional_headers(self, url):
+        """Cabeceras `If-None-Match` / `If-Modified-Since` para `url` (o `{}`)."""
+        record = self.get(url) or {}
+        headers = {}
+        if record.get('etag'):
+            headers['If-None-Match'] = record['etag']
+        if record.get('last_modified'):
+            headers['If-Modified-Since'] = record['last_modified']
+        return headers
+
+    def update_from_response(self, url, resp):
+        """Registra los validadores de una respuesta 200 (descarta `details` antiguos)."""
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        with self._lock:
+            if not etag and not last_modified:
+                if self._records.pop(url, None) is not None:
+                    self._dirty = True
+                return
+            self._records[url] = {'etag': etag, 'last_modified': last_modified, 'details': None}
+            self._records.move_to_end(url)
+            self._dirty = True
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+
+    def touch(self, url):
+        with self._lock:
+            if url in self._records:
+                self._records.move_to_end(url)
+                self._dirty = True
+
+    def set_details(self, url, details):
+        """Asocia datos extraídos al cuerpo actualmente validado de `url`."""
+        with self._lock:
+            record = self._records.get(url)
+            if record is not None:
+                record['details'] = details
+                self._dirty = True
+
+    def get_details(self, url):
+        with self._lock:
+            record = self._records.get(url)
+            return record.get('details') if record else None
@@ -1,7 +1,12 @@
-from Scraper.Base_Scraper import NewsScraperBase
+from Scraper.Base_Scraper import NewsScraperBase, class_strainer
 from urllib.parse import urljoin
 
 class ABCScraper(NewsScraperBase):
+    # Portada: solo el contenedor `div.voc-wrapper`
+    list_strainer = class_strainer('div', 'voc-wrapper')
+    # La tarjeta de portada también trae el autor
+    list_fields = ('id', 'newspaper', 'date', 'title', 'url', 'author')
+
     def __init__(self):
         super().__init__('abc.es')
     
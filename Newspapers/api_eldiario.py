@@ -1,8 +1,13 @@
 from Flask_App.Flask_App import NewsFlaskApp
-from Scraper.Base_Scraper import NewsScraperBase
+from Scraper.Base_Scraper import NewsScraperBase, class_strainer
 import re
 
 class ElDiarioScraper(NewsScraperBase):
+    # Portada: solo las tarjetas `figure.ni-figure`
+    list_strainer = class_strainer('figure', 'ni-figure')
+    # La tarjeta de portada también trae el autor
+    list_fields = ('id', 'newspaper', 'date', 'title', 'url', 'author')
+
     def __init__(self):
         super().__init__('eldiario.es')
     
@@ -1,8 +1,14 @@
 from Scraper.Base_Scraper import NewsScraperBase
+from bs4 import SoupStrainer
 import re
 
 
 class ElMundoScraper(NewsScraperBase):
+    # Portada: solo las tarjetas `<article>`
+    list_strainer = SoupStrainer('article')
+    # La tarjeta de portada trae todo salvo el cuerpo
+    list_fields = ('id', 'newspaper', 'date', 'tags', 'title', 'subtitle', 'url', 'author', 'image')
+
     def __init__(self):
         super().__init__('El Mundo')
 
@@ -1,6 +1,12 @@
 from Scraper.Base_Scraper import NewsScraperBase
+from bs4 import SoupStrainer
 
 class ElPaisScraper(NewsScraperBase):
+    # Portada: solo `<main>`
+    list_strainer = SoupStrainer('main')
+    # La tarjeta de portada también trae el autor
+    list_fields = ('id', 'newspaper', 'date', 'title', 'url', 'author')
+
     def __init__(self):
         super().__init__('El País')
     
@@ -1,7 +1,13 @@
 from Scraper.Base_Scraper import NewsScraperBase
+from bs4 import SoupStrainer
 import re
 
 class LaRazonScraper(NewsScraperBase):
+    # Portada: solo `<main>`
+    list_strainer = SoupStrainer('main')
+    # La tarjeta de portada también trae el autor
+    list_fields = ('id', 'newspaper', 'date', 'title', 'url', 'author')
+
     def __init__(self):
         super().__init__('larazon.es')
     
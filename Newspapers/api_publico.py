@@ -1,8 +1,14 @@
 from Scraper.Base_Scraper import NewsScraperBase
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
 import re
 
 class PublicoScraper(NewsScraperBase):
+    # Portada: `<main>` y los `<article>` sueltos (el parser cae a `soup` si no hay main)
+    list_strainer = SoupStrainer(['main', 'article'])
+    # La tarjeta de portada también trae el autor
+    list_fields = ('id', 'newspaper', 'date', 'title', 'url', 'author')
+
     def __init__(self):
         super().__init__('publico.es')
 
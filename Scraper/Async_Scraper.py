@@ -0,0 +1,79 @@
+import asyncio
+
+from Http_Client.async_http_client import AsyncNewsHTTPClient
+
+
+class AsyncNewsScraper:
+    """Contraparte asyncio de `NewsScraperBase`.
+
+    Envuelve un scraper existente y reutiliza sus parsers
+    (`_scrape_list_articles` / `_scrape_article_details`) sin cambios:
+
+    1. Descarga la portada.
+    2. Ejecuta el parser de lista en modo "descubrimiento" para saber qué
+       artículos pediría, sin descargarlos.
+    3. Descarga y parsea todos los detalles en paralelo (acotado por dominio y global).
+    4. Vuelve a ejecutar el parser de lista con los detalles ya resueltos y
+       enriquece cada artículo sin repetir descargas.
+    """
+
+    def __init__(self, scraper, client=None):
+        self.scraper = scraper
+        self.client = client or AsyncNewsHTTPClient()
+
+    @property
+    def name(self):
+        return self.scraper.name
+
+    async def get_page(self, url, page_type=None):
+        return await self.client.run(url, self.scraper.get_page, url, page_type)
+
+    async def scrape_article_details(self, url):
+        # Sin red (caché vigente) no se consume turno del limitador
+        return await self.client.run(url, self.scraper.scrape_article_details, url,
+                                     rate_limited=not self.scraper.http.is_cached(url))
+
+    async def fetch_details(self, urls):
+        """Descarga en paralelo los detalles de `urls`. Los fallos se devuelven como `{}`.
+
+        Los aciertos del memo, de los artículos conocidos y de la caché con
+        detalles se resuelven aquí mismo, sin ocupar semáforos ni turnos de
+        descarga: solo las URLs que necesitan red pasan por el cliente.
+        """
+        urls = list(dict.fromkeys(u for u in urls if u))
+        details = {}
+        pending = []
+        for u in urls:
+            local = self.scraper.local_article_details(u)
+            if local is not None:
+                details[u] = local
+            else:
+                pending.append(u)
+        results = await asyncio.gather(*(self.scrape_article_details(u) for u in pending),
+                                       return_exceptions=True)
+        details.update({u: (r if isinstance(r, dict) else {}) for u, r in zip(pending, results)})
+        return {u: details[u] for u in urls}
+
+    async def scrape_list_page(self, url):
+        """Equivalente a `NewsScraperBase.scrape_list_page` con detalles concurrentes."""
+        soup = await self.get_page(url, 'list')
+        urls = self.scraper.collect_detail_urls(soup, url)
+        details = await self.fetch_details(urls)
+        return self.scraper.scrape_list_with_details(soup, url, details), details
+
+    async def scrape_and_enrich(self, url):
+        """Portada + detalles + `enrich_article` para todos los artículos, en paralelo."""
+        results, details = await self.scrape_list_page(url)
+        missing = [a.get('url') for a in results if a.get('url') and a.get('url') not in details]
+        details.update(await self.fetch_details(missing))
+
+        enriched = []
+        for art in results:
+            art_details = details.get(art.get('url')) if art else None
+            if art_details:
+                try:
+                    art = self.scraper.merge_details(art, art_details)
+                except Exception:
+                    pass
+            enriched.append(art)
+        return enriched
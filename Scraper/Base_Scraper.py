@@ -1,41 +1,450 @@
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+import contextlib
+import contextvars
+import threading
+import time
+import json
+import re
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from Http_Client.http_client import NewsHTTPClient
 from Utils.Text_Utils import TextUtils
 from Utils.Date_Utils import DateUtils
 from Utils.Id_Utils import IDUtils
 from Utils.Article_Utils import ArticleUtils
 from Utils.Image_Utils import ImageUtils
+from Utils.Encoding_Utils import EncodingUtils
+
+# Tipos schema.org que se aceptan como artículo en los bloques JSON-LD
+_JSONLD_ARTICLE_TYPES = {
+    'newsarticle', 'article', 'reportagenewsarticle', 'analysisnewsarticle',
+    'opinionnewsarticle', 'reviewnewsarticle', 'backgroundnewsarticle',
+    'blogposting', 'liveblogposting'
+}
+
+# Campos de detalle que el fast path JSON-LD debe cubrir para evitar el parser del sitio
+DETAIL_FIELDS = ('title', 'subtitle', 'author', 'tags', 'body', 'image')
+
+# Campos de un artículo (orden de `ArticleUtils.create_ordered_article`)
+ARTICLE_FIELDS = ('id', 'newspaper', 'date', 'tags', 'title', 'subtitle', 'url', 'author', 'image', 'body')
+
+
+def class_strainer(tag, css_class):
+    """`SoupStrainer` para `tag` con la clase CSS `css_class`.
+
+    Al filtrar, el atributo `class` aún no está dividido en valores (p. ej.
+    "x voc-wrapper"), así que se compara con una regex por palabra.
+    """
+    return SoupStrainer(tag, class_=re.compile(r'(^|\s)' + re.escape(css_class) + r'(\s|$)'))
+
 
 class NewsScraperBase(ABC):
+    # Backend de BeautifulSoup: 'lxml' (rápido, ya en requirements) o 'html.parser'
+    parser_backend = 'lxml'
+    # `SoupStrainer` opcional por tipo de página: si se define, solo se
+    # construye ese subárbol del documento (ver `build_soup`)
+    list_strainer = None
+    detail_strainer = None  # si se define, debe incluir script[type=application/ld+json]
+    # Campos que la tarjeta de portada aporta por sí sola, sin descargar el artículo
+    list_fields = ('id', 'newspaper', 'date', 'title', 'url')
+
     def __init__(self, name):
         self.name = name
-        self.http = NewsHTTPClient()
+        self.http = NewsHTTPClient.shared()  # pool keep-alive común a todos los scrapers
         self.text = TextUtils()
         self.date = DateUtils()
         self.idgen = IDUtils()
         self.article = ArticleUtils()
         self.image = ImageUtils()
-    
-    def get_page(self, url):
-        """ÚNICA función HTTP simple con validación URL."""
+        # Estado por hilo: permite al motor async sustituir la descarga de detalles
+        self._local = threading.local()
+        # Contadores del scraper (revalidaciones, etc.)
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+        # Memo de detalles por URL de la ejecución o petición en curso (ver `run_scope`)
+        self._scope = contextvars.ContextVar(f'run_scope_{name}', default=None)
+
+    def _count(self, key, n=1):
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + n
+
+    @contextlib.contextmanager
+    def run_scope(self, known=None):
+        """Memo de detalles por URL válido durante una ejecución o petición.
+
+        Dentro del bloque cada página de artículo se descarga y parsea como
+        mucho una vez: el parser de lista y `enrich_article` comparten el
+        resultado. El memo vive en una `ContextVar`: cada petición (hilo o
+        tarea asyncio) tiene el suyo y se libera al salir del bloque; los
+        bloques anidados en el mismo contexto comparten el del exterior.
+
+        `known` son artículos ya conocidos (p. ej. del histórico), que así no
+        se vuelven a descargar: un dict {url: details} o cualquier objeto con
+        `get(url)` que los consulte bajo demanda (ver `Storage`).
+        """
+        scope = self._scope.get()
+        if scope is not None:
+            memo, sources = scope
+            if known:
+                sources.append(known)
+            try:
+                yield memo
+            finally:
+                if known:
+                    sources.pop()
+            return
+
+        token = self._scope.set(({}, [known] if known else []))
+        try:
+            yield self._scope.get()[0]
+        finally:
+            self._scope.reset(token)
+
+    @property
+    def _memo(self):
+        scope = self._scope.get()
+        return scope[0] if scope is not None else None
+
+    @property
+    def _memo_sources(self):
+        scope = self._scope.get()
+        return scope[1] if scope is not None else ()
+
+    @contextlib.contextmanager
+    def deadline(self, seconds):
+        """Plazo máximo para las descargas del hilo actual.
+
+        Pasado el plazo, `fetch` lanza `TimeoutError` en lugar de hacer otra
+        petición, y la petición en vuelo tiene como timeout lo que quede de
+        plazo, de modo que un periódico lento abandona su pipeline sin
+        afectar a los demás.
+        """
+        self._local.deadline = (time.monotonic() + seconds) if seconds else None
+        try:
+            yield
+        finally:
+            self._local.deadline = None
+
+    def deadline_exceeded(self):
+        deadline = getattr(self._local, 'deadline', None)
+        return deadline is not None and time.monotonic() > deadline
+
+    def fetch(self, url, **kwargs):
+        """GET con validación de URL. `kwargs` se pasan a `NewsHTTPClient.get`."""
         if not url.startswith(('http://', 'https://')):
             raise ValueError(f"URL inválida: {url}. Debe empezar con http:// o https://")
-        
-        resp = self.http.get(url)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, 'html.parser')
+        if self.deadline_exceeded():
+            raise TimeoutError(f"{self.name}: plazo agotado antes de {url}")
+
+        resp = self.http.get(url, deadline=getattr(self._local, 'deadline', None), **kwargs)
+        if not getattr(resp, 'not_modified', False):
+            resp.raise_for_status()
+        return resp
+
+    def build_soup(self, markup, page_type=None, backend=None, from_encoding=None):
+        """Construye el árbol con el backend configurado y el strainer de `page_type`.
+
+        `page_type` es 'list' o 'detail'; con `None` se parsea el documento entero.
+        `markup` puede ser str o bytes (con `from_encoding`).
+        """
+        strainer = {'list': self.list_strainer, 'detail': self.detail_strainer}.get(page_type)
+        backend = backend or self.parser_backend
+        if isinstance(markup, str):
+            from_encoding = None
+        try:
+            return BeautifulSoup(markup, backend, parse_only=strainer, from_encoding=from_encoding)
+        except FeatureNotFound:
+            return BeautifulSoup(markup, 'html.parser', parse_only=strainer, from_encoding=from_encoding)
+
+    def parse(self, resp, page_type=None):
+        """Parsea los bytes de `resp` directamente (sin `resp.text`).
+
+        Evita que requests detecte el charset sobre todo el cuerpo y que se
+        decodifique a str antes de parsear. La codificación sale de la
+        cabecera o de `<meta charset>` (ver `EncodingUtils.resolve`).
+        Registra tiempos por periódico en `self.stats`: `charset_ms` es solo la
+        resolución del charset; la decodificación ocurre dentro del parser y
+        cuenta en `parse_ms`.
+        """
+        started = time.perf_counter()
+        encoding, source = EncodingUtils.resolve(resp)
+        resolved = time.perf_counter()
+        soup = self.build_soup(resp.content, page_type, from_encoding=encoding)
+        finished = time.perf_counter()
+
+        self._count('pages_parsed')
+        self._count(f'encoding_{source}')
+        self._count('charset_ms', (resolved - started) * 1000)
+        self._count('parse_ms', (finished - resolved) * 1000)
+        return soup
+
+    def get_page(self, url, page_type=None):
+        """ÚNICA función HTTP simple con validación URL."""
+        return self.parse(self.fetch(url), page_type)
 
     
-    def scrape_list_page(self, url):
-        """Llama SOLO a método específico de subclase."""
-        soup = self.get_page(url)
-        return self._scrape_list_articles(soup, url)
+    def scrape_list_page(self, url, fields=None):
+        """Llama SOLO a método específico de subclase.
+
+        Con `fields` se devuelven solo esos campos; si la tarjeta de portada
+        los cubre todos (ver `list_fields`) no se descarga ningún artículo.
+        """
+        soup = self.get_page(url, 'list')
+        if self.needs_details(fields):
+            results = self._scrape_list_articles(soup, url)
+        else:
+            results = self._run_list_parser(soup, url, lambda detail_url: {})
+        if fields is None:
+            return results
+        return [self.project(art, fields) for art in results]
+
+    def needs_details(self, fields):
+        """¿Hace falta descargar los artículos para rellenar `fields`? (`None` = todos)"""
+        return fields is None or not set(fields) <= set(self.list_fields)
+
+    @staticmethod
+    def project(article, fields):
+        """Solo los campos `fields` de `article` (las entradas de error se dejan intactas)."""
+        if not article or 'error' in article:
+            return article
+        return {k: v for k, v in article.items() if k in fields}
     
     def scrape_article_details(self, url):
         """Llama SOLO a método específico de subclase."""
-        soup = self.get_page(url)
-        return self._scrape_article_details(soup)
+        hook = getattr(self._local, 'details_hook', None)
+        if hook is not None:
+            return hook(url)
+
+        details = self.local_article_details(url)
+        if details is not None:
+            return details
+
+        details = self._fetch_article_details(url)
+        if self._memo is not None:
+            self._memo[url] = details
+        return details
+
+    def local_article_details(self, url):
+        """Detalles de `url` disponibles sin red, o `None`.
+
+        Orden: memo de la ejecución → artículos conocidos (`run_scope(known=...)`)
+        → caché en disco vigente con los detalles ya extraídos. El motor async
+        lo consulta antes de reservar turno de descarga.
+        """
+        memo = self._memo
+        if memo is not None:
+            if url in memo:
+                self._count('duplicate_fetches_avoided')
+                return dict(memo[url])
+            for source in self._memo_sources:
+                known = source.get(url)
+                if known is not None:
+                    memo[url] = known
+                    self._count('known_articles_skipped')
+                    return dict(known)
+
+        if self.http.is_cached(url):
+            previous = self.http.validators.get_details(url)
+            if previous is not None:
+                self._count('details_not_modified')
+                if memo is not None:
+                    memo[url] = previous
+                return dict(previous)
+        return None
+
+    def _fetch_article_details(self, url):
+        """Descarga y parsea `url` con revalidación condicional."""
+        # Revalidación: si conservamos los detalles de la última versión, una GET
+        # condicional que devuelva 304 (o un acierto de caché) evita reparsear.
+        previous = self.http.validators.get_details(url)
+        resp = self.fetch(url, conditional=previous is not None)
+        if previous is not None and (resp.not_modified or resp.from_cache):
+            self._count('details_not_modified')
+            return dict(previous)
+        if resp.not_modified and not resp.content:
+            # 304 sin cuerpo cacheado ni detalles previos: descarga completa
+            # (con cuerpo en caché se parsea ese, que sigue vigente)
+            resp = self.fetch(url, use_cache=False)
+
+        details = self.extract_details(self.parse(resp, 'detail'))
+        self.http.validators.set_details(url, details)
+        return details
+
+    def extract_details(self, soup):
+        """Detalles de un artículo: JSON-LD primero, selectores del sitio para lo que falte.
+
+        Si el bloque `application/ld+json` (NewsArticle) cubre todos los campos
+        no se ejecuta `_scrape_article_details` (para la imagen basta la URL: el
+        JSON-LD casi nunca trae créditos). Si hay que ejecutarlo, sus valores se
+        respetan y el JSON-LD solo rellena los campos que dejó vacíos. Cuenta en
+        `self.stats` cuántas veces bastó el fast path (`jsonld_full`), cuántas
+        aportó solo parte (`jsonld_partial`) y cuántas no había JSON-LD (`jsonld_none`).
+        """
+        ld = self.extract_jsonld_article(soup)
+        missing = [f for f in DETAIL_FIELDS if not ld.get(f)]
+        if ld.get('image') and not ld['image'].get('url'):
+            missing.append('image')
+        if not missing:
+            self._count('jsonld_full')
+            return ld
+
+        self._count('jsonld_partial' if ld else 'jsonld_none')
+        details = self._scrape_article_details(soup)
+        if not ld:
+            return details
+        for field, value in ld.items():
+            if field == 'image':
+                site_image = details.get('image') or {}
+                details['image'] = {
+                    'url': site_image.get('url') or value.get('url', ''),
+                    'credits': site_image.get('credits') or value.get('credits', '')
+                }
+            elif value and not details.get(field):
+                details[field] = value
+        return details
+
+    def extract_jsonld_article(self, soup):
+        """Campos de un bloque JSON-LD de tipo NewsArticle (o `{}` si no hay).
+
+        Devuelve las mismas claves que `_scrape_article_details` (más `date`),
+        solo con los valores presentes, limpiados con `TextUtils.cleantext`.
+        """
+        node = None
+        for script in soup.find_all('script', attrs={'type': 'application/ld+json'}):
+            try:
+                data = json.loads(script.string or script.get_text() or '', strict=False)
+            except ValueError:
+                continue
+            node = self._find_jsonld_article(data)
+            if node:
+                break
+        if not node:
+            return {}
+
+        ld = {}
+        ld['title'] = self.text.cleantext(node.get('headline') or node.get('name'))
+        ld['subtitle'] = self.text.cleantext(node.get('description') or node.get('alternativeHeadline'))
+        ld['author'] = self.text.cleantext(', '.join(self._jsonld_names(node.get('author'))))
+        keywords = node.get('keywords') or []
+        if isinstance(keywords, str):
+            keywords = keywords.split(',')
+        ld['tags'] = [t for t in (self.text.cleantext(k) for k in keywords if isinstance(k, str)) if t][:8]
+        ld['body'] = self.text.cleantext(node.get('articleBody'))[:3000]
+        ld['image'] = self._jsonld_image(node.get('image'))
+        if node.get('datePublished'):
+            ld['date'] = self.date.normalizedatetime(node['datePublished'])
+        return {k: v for k, v in ld.items() if v}
+
+    @staticmethod
+    def _find_jsonld_article(data):
+        """Busca recursivamente (listas, `@graph`) el primer nodo de tipo artículo."""
+        if isinstance(data, list):
+            for item in data:
+                found = NewsScraperBase._find_jsonld_article(item)
+                if found:
+                    return found
+            return None
+        if not isinstance(data, dict):
+            return None
+        types = data.get('@type') or []
+        if isinstance(types, str):
+            types = [types]
+        if any(str(t).lower() in _JSONLD_ARTICLE_TYPES for t in types):
+            return data
+        if '@graph' in data:
+            return NewsScraperBase._find_jsonld_article(data['@graph'])
+        return None
+
+    @staticmethod
+    def _jsonld_names(value):
+        if isinstance(value, list):
+            return [n for v in value for n in NewsScraperBase._jsonld_names(v)]
+        if isinstance(value, dict):
+            return [value['name']] if isinstance(value.get('name'), str) else []
+        if isinstance(value, str):
+            return [value]
+        return []
+
+    def _jsonld_image(self, value):
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if isinstance(value, str):
+            return {'url': value, 'credits': ''}
+        if isinstance(value, dict):
+            credits = self.image.format_credits(
+                self.text.cleantext(value.get('caption')),
+                self.text.cleantext(value.get('creditText')),
+                ', '.join(self._jsonld_names(value.get('copyrightHolder') or value.get('author')))
+            )
+            return {'url': value.get('url') or value.get('contentUrl') or '', 'credits': credits}
+        return {}
+
+    def _run_list_parser(self, soup, base_url, hook):
+        """Ejecuta `_scrape_list_articles` resolviendo los detalles con `hook(url)`."""
+        self._local.details_hook = hook
+        try:
+            return self._scrape_list_articles(soup, base_url)
+        finally:
+            self._local.details_hook = None
+
+    def collect_detail_urls(self, soup, base_url):
+        """Devuelve las URLs de detalle que pediría el parser de lista, sin descargarlas."""
+        urls = []
+
+        def record(url):
+            if url not in urls:
+                urls.append(url)
+            return {}
+
+        self._run_list_parser(soup, base_url, record)
+        return urls
+
+    def scrape_list_with_details(self, soup, base_url, details_by_url):
+        """Parser de lista usando detalles ya descargados (p. ej. en paralelo)."""
+        return self._run_list_parser(soup, base_url, lambda url: details_by_url.get(url) or {})
+
+    def iter_list_page(self, url):
+        """Generador: artículos de la portada enriquecidos y emitidos de uno en uno.
+
+        1. Parsea la portada en modo descubrimiento (sin descargar detalles).
+        2. Por cada tarjeta descarga sus detalles, los fusiona y la emite: el
+           primer artículo sale tras una sola descarga de detalle.
+        3. Si el parser solo genera alguna tarjeta cuando tiene detalles, vuelve
+           a pasarlo sobre la misma sopa descargando solo esas URLs.
+
+        No usa el memo de `run_scope`: solo se retienen las URLs ya emitidas.
+        """
+        soup = self.get_page(url, 'list')
+        requested = []
+
+        def record(detail_url):
+            if detail_url not in requested:
+                requested.append(detail_url)
+            return {}
+
+        emitted = set()
+        for card in self._run_list_parser(soup, url, record):
+            if card and card.get('url'):
+                emitted.add(card['url'])
+            yield self.enrich_article(card)
+
+        missing = {u for u in requested if u not in emitted}
+        if not missing:
+            return
+
+        fetched = {}
+
+        def fetch_missing(detail_url):
+            if detail_url not in missing:
+                return {}
+            if detail_url not in fetched:
+                # El hook está activo: descarga directa, sin pasar por `scrape_article_details`
+                fetched[detail_url] = self._fetch_article_details(detail_url)
+            return fetched[detail_url]
+
+        for card in self._run_list_parser(soup, url, fetch_missing):
+            if card and card.get('url') in missing and card['url'] not in emitted:
+                emitted.add(card['url'])
+                yield self.merge_details(card, fetched.get(card['url']) or {})
 
     def enrich_article(self, article):
         """Implementación por defecto para enriquecer un artículo de lista.
@@ -51,6 +460,10 @@ class NewsScraperBase(ABC):
         except Exception:
             return article
 
+        return self.merge_details(article, details)
+
+    def merge_details(self, article, details):
+        """Fusiona `details` (salida de `_scrape_article_details`) en `article`."""
         # Solo sobrescribir campos cuando los detalles contengan valores no vacíos.
         article['subtitle'] = details.get('subtitle') or article.get('subtitle', '')
         article['author'] = details.get('author') or article.get('author', 'Redacción')
@@ -0,0 +1,237 @@
+"""Almacén de artículos en SQLite (modo WAL).
+
+Sustituye la lectura/reescritura completa de `noticias_completas.json` en cada
+ejecución: las altas se insertan por lotes con upsert, la retención es un
+único DELETE indexado y el JSON se exporta como snapshot (mismo formato que
+antes) para los consumidores existentes.
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    key          TEXT NOT NULL UNIQUE,   -- url (o hash si el artículo no tiene url)
+    url          TEXT,
+    id           TEXT,
+    hash         TEXT,
+    domain       TEXT,
+    scraped_at   TEXT,
+    refreshed_at TEXT,
+    data         TEXT NOT NULL           -- artículo completo en JSON (orden de campos original)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(hash);
+CREATE INDEX IF NOT EXISTS idx_articles_id ON articles(id);
+CREATE INDEX IF NOT EXISTS idx_articles_domain ON articles(domain, url);
+CREATE INDEX IF NOT EXISTS idx_articles_scraped_at ON articles(scraped_at);
+"""
+
+
+class KnownArticles:
+    """Consulta perezosa de artículos ya guardados de un dominio.
+
+    Se pasa a `NewsScraperBase.run_scope(known=...)`: solo se consulta la base
+    para las URLs que aparecen en la portada, no se carga el histórico.
+    """
+
+    def __init__(self, store, domain, fields, refresh_hours=None):
+        self.store = store
+        self.domain = domain
+        self.fields = fields
+        self.cutoff = (datetime.now() - timedelta(hours=refresh_hours)).isoformat() if refresh_hours else None
+
+    def get(self, url, default=None):
+        row = self.store.conn.execute(
+            "SELECT data, COALESCE(refreshed_at, scraped_at) FROM articles WHERE key = ? AND domain = ?",
+            (url, self.domain)
+        ).fetchone()
+        if row is None or (self.cutoff and (row[1] or '') < self.cutoff):
+            return default
+        article = json.loads(row[0])
+        return {k: article.get(k) for k in self.fields}
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+
+class SQLiteArticleStore:
+    """Histórico de artículos indexado por `hash`, `id`, `domain` y `scraped_at`."""
+
+    def __init__(self, path='noticias.db'):
+        self.path = path
+        self._local = threading.local()
+        self.conn.executescript(_SCHEMA)
+
+    @property
+    def conn(self):
+        """Una conexión por hilo (WAL permite lecturas concurrentes)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    @staticmethod
+    def _key(article):
+        return article.get('url') or article.get('hash')
+
+    def import_json(self, path):
+        """Carga inicial desde un JSON existente (solo si la base está vacía)."""
+        if self.count() or not os.path.exists(path):
+            return 0
+        with open(path, 'r', encoding='utf-8') as f:
+            articles = json.load(f)
+        # En empates de `scraped_at` el export sigue el orden de inserción (`seq`)
+        self.upsert(articles, fields=())
+        return len(articles)
+
+    def known(self, domain, fields, refresh_hours=None):
+        return KnownArticles(self, domain, fields, refresh_hours)
+
+    def upsert(self, articles, fields):
+        """Inserta artículos nuevos y actualiza los conocidos cuyo contenido cambió.
+
+        `fields` son los campos de contenido que se comparan para decidir si
+        un artículo conocido se ha refrescado. Devuelve `(nuevos, refrescados)`.
+        """
+        articles = [a for a in articles if self._key(a)]
+        if not articles:
+            return 0, 0
+        keys = [self._key(a) for a in articles]
+        existing = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT key, data FROM articles WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            existing.update((k, json.loads(d)) for k, d in rows)
+        hashes = {a.get('hash') for a in articles if a.get('hash')}
+        known_hashes = set()
+        hash_list = list(hashes)
+        for start in range(0, len(hash_list), 500):
+            chunk = hash_list[start:start + 500]
+            known_hashes.update(r[0] for r in self.conn.execute(
+                f"SELECT hash FROM articles WHERE hash IN ({','.join('?' * len(chunk))})", chunk))
+
+        rows = []
+        new = refreshed = 0
+        for art, key in zip(articles, keys):
+            old = existing.get(key)
+            if old is not None:
+                changes = {k: art.get(k) for k in fields if art.get(k) and art.get(k) != old.get(k)}
+                if not changes:
+                    continue
+                old.update(changes)
+                old['refreshed_at'] = art.get('scraped_at')
+                art = old
+                refreshed += 1
+            elif art.get('hash') in known_hashes:
+                continue
+            else:
+                new += 1
+                known_hashes.add(art.get('hash'))
+            existing[key] = art
+            rows.append((key, art.get('url'), art.get('id'), art.get('hash'), art.get('domain'),
+                         art.get('scraped_at'), art.get('refreshed_at'),
+                         json.dumps(art, ensure_ascii=False)))
+
+        with self.conn:
+            self.conn.executemany(
+                """INSERT INTO articles (key, url, id, hash, domain, scraped_at, refreshed_at, data)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(key) DO UPDATE SET
+                       hash = excluded.hash,
+                       refreshed_at = excluded.refreshed_at,
+                       data = excluded.data""",
+                rows
+            )
+        return new, refreshed
+
+    def purge(self, days=7):
+        """Retención: un único DELETE sobre el índice de `scraped_at`."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self.conn:
+            return self.conn.execute("DELETE FROM articles WHERE scraped_at < ?", (cutoff,)).rowcount
+
+    def iter_recent(self, fields=None):
+        """Artículos del más reciente al más antiguo (mismo orden que el JSON histórico).
+
+        Con `fields` (campos escalares) solo se extraen esos campos en SQL,
+        sin decodificar el artículo completo.
+        """
+        if fields is None:
+            for (data,) in self.conn.execute("SELECT data FROM articles ORDER BY scraped_at DESC, seq ASC"):
+                yield json.loads(data)
+            return
+        columns = ', '.join(f"json_extract(data, '$.{f}')" for f in fields)
+        for row in self.conn.execute(f"SELECT {columns} FROM articles ORDER BY scraped_at DESC, seq ASC"):
+            yield dict(zip(fields, row))
+
+    def get_many(self, keys, fields=None):
+        """{clave: artículo (o solo `fields`)} de las claves guardadas."""
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT key, data FROM articles WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            for key, data in rows:
+                article = json.loads(data)
+                found[key] = article if fields is None else {k: article.get(k) for k in fields}
+        return found
+
+    def annotate(self, updates):
+        """Aplica `{clave: {campo: valor}}` a artículos guardados sin marcarlos como refrescados.
+
+        Para anotaciones derivadas (`simhash`, `story_id`...) calculadas sobre
+        el histórico. Devuelve el número de artículos actualizados.
+        """
+        rows = []
+        for key, article in self.get_many(updates).items():
+            changes = {k: v for k, v in updates[key].items() if article.get(k) != v}
+            if changes:
+                article.update(changes)
+                rows.append((json.dumps(article, ensure_ascii=False), key))
+        with self.conn:
+            self.conn.executemany("UPDATE articles SET data = ? WHERE key = ?", rows)
+        return len(rows)
+
+    def top_domains(self, limit=100, top=5):
+        rows = self.conn.execute(
+            """SELECT domain, COUNT(*) AS n FROM (
+                   SELECT domain FROM articles ORDER BY scraped_at DESC, seq ASC LIMIT ?
+               ) GROUP BY domain ORDER BY n DESC LIMIT ?""", (limit, top)
+        ).fetchall()
+        return {d or '?': n for d, n in rows}
+
+    def export_json(self, path):
+        """Snapshot en el formato de `noticias_completas.json` (lista, indent=2), en streaming.
+
+        Produce el mismo texto que `json.dump(lista, indent=2)` sin cargar toda
+        la lista en memoria.
+        """
+        count = 0
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for art in self.iter_recent():
+                item = json.dumps(art, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+                f.write(('[\n  ' if count == 0 else ',\n  ') + item)
+                count += 1
+            f.write('\n]' if count else '[]')
+        os.replace(tmp, path)
+        return count
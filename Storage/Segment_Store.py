@@ -0,0 +1,267 @@
+"""Histórico en segmentos JSON Lines de solo anexado, uno por día (y opcionalmente por periódico).
+
+    noticias/
+        manifest.json            # segmentos del más reciente al más antiguo
+        2026-10-18.jsonl         # un artículo por línea
+        2026-10-18/abc.es.jsonl  # (con `per_newspaper=True`)
+
+- Cada ejecución solo añade líneas al segmento del día: los diffs que sube el
+  workflow son las líneas nuevas, no el array completo reformateado.
+- Un artículo refrescado se vuelve a anexar; al leer gana el registro más reciente.
+- La retención borra segmentos completos caducados, sin leer sus registros.
+"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+MANIFEST = 'manifest.json'
+
+
+class KnownSegmentArticles:
+    """Artículos conocidos de un dominio (para `NewsScraperBase.run_scope(known=...)`)."""
+
+    def __init__(self, store, domain, fields, refresh_hours=None):
+        self.store = store
+        self.domain = domain
+        self.fields = fields
+        self.cutoff = (datetime.now() - timedelta(hours=refresh_hours)).isoformat() if refresh_hours else None
+
+    def get(self, url, default=None):
+        article = self.store.records().get(url)
+        if article is None or article.get('domain') != self.domain:
+            return default
+        if self.cutoff and (article.get('refreshed_at') or article.get('scraped_at') or '') < self.cutoff:
+            return default
+        return {k: article.get(k) for k in self.fields}
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+
+class SegmentArticleStore:
+    """Misma interfaz que `SQLiteArticleStore`, sobre ficheros JSONL por día."""
+
+    def __init__(self, path='noticias', per_newspaper=False):
+        self.path = path
+        self.per_newspaper = per_newspaper
+        self._lock = threading.Lock()
+        self._records = None
+        os.makedirs(path, exist_ok=True)
+        self._manifest = self._load_manifest()
+
+    # ── manifest ────────────────────────────────────────────
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.path, MANIFEST), 'r', encoding='utf-8') as f:
+                segments = json.load(f)['segments']
+        except (OSError, ValueError, KeyError):
+            segments = []
+        return [s for s in segments if os.path.exists(os.path.join(self.path, s['file']))]
+
+    def _save_manifest(self):
+        self._manifest.sort(key=lambda s: (s['day'], s.get('domain') or ''), reverse=True)
+        tmp = os.path.join(self.path, MANIFEST + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'updated_at': datetime.now().isoformat(), 'segments': self._manifest},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(tmp, os.path.join(self.path, MANIFEST))
+
+    def segments(self):
+        """Segmentos del manifest, del día más reciente al más antiguo."""
+        return list(self._manifest)
+
+    def _segment_for(self, article):
+        day = (article.get('scraped_at') or datetime.now().isoformat())[:10]
+        domain = (article.get('domain') or '_') if self.per_newspaper else None
+        name = f"{day}/{domain}.jsonl" if domain else f"{day}.jsonl"
+        for segment in self._manifest:
+            if segment['file'] == name:
+                return segment
+        segment = {'file': name, 'day': day, 'domain': domain, 'records': 0, 'bytes': 0}
+        self._manifest.append(segment)
+        return segment
+
+    # ── lectura ─────────────────────────────────────────────
+
+    def _read_segment(self, segment):
+        with open(os.path.join(self.path, segment['file']), 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def _key(article):
+        return article.get('url') or article.get('hash')
+
+    def records(self):
+        """Índice {url: último registro} (se carga una vez, del segmento más antiguo al más nuevo)."""
+        with self._lock:
+            if self._records is None:
+                records = {}
+                for segment in reversed(self._manifest):
+                    for article in self._read_segment(segment):
+                        if self._key(article):
+                            records[self._key(article)] = article
+                self._records = records
+            return self._records
+
+    def count(self):
+        return len(self.records())
+
+    def iter_recent(self, fields=None):
+        """Artículos del más reciente al más antiguo, leyendo primero los segmentos nuevos.
+
+        Cada día se ordena por `scraped_at` (estable); una URL repetida se
+        emite una sola vez, con su registro más reciente. Con `fields` solo se
+        conservan esos campos de cada registro.
+        """
+        seen = set()
+        days = {}
+        for segment in self._manifest:
+            days.setdefault(segment['day'], []).append(segment)
+        for day in sorted(days, reverse=True):
+            latest = {}
+            for segment in sorted(days[day], key=lambda s: s['file']):
+                for article in self._read_segment(segment):
+                    latest[self._key(article)] = article
+            for article in sorted(latest.values(), key=lambda a: a.get('scraped_at', ''), reverse=True):
+                key = self._key(article)
+                if key not in seen:
+                    seen.add(key)
+                    yield article if fields is None else {k: article.get(k) for k in fields}
+
+    def get_many(self, keys, fields=None):
+        """{clave: artículo (o solo `fields`)} de las claves guardadas."""
+        records = self.records()
+        found = {}
+        for key in keys:
+            article = records.get(key)
+            if article is not None:
+                found[key] = article if fields is None else {k: article.get(k) for k in fields}
+        return found
+
+    def known(self, domain, fields, refresh_hours=None):
+        return KnownSegmentArticles(self, domain, fields, refresh_hours)
+
+    def top_domains(self, limit=100, top=5):
+        domains = {}
+        for i, article in enumerate(self.iter_recent()):
+            if i >= limit:
+                break
+            domains[article.get('domain', '?')] = domains.get(article.get('domain', '?'), 0) + 1
+        return dict(sorted(domains.items(), key=lambda x: x[1], reverse=True)[:top])
+
+    # ── escritura ───────────────────────────────────────────
+
+    def import_json(self, path):
+        """Carga inicial desde un JSON existente (solo si no hay segmentos)."""
+        if self._manifest or not os.path.exists(path):
+            return 0
+        with open(path, 'r', encoding='utf-8') as f:
+            articles = json.load(f)
+        # El JSON está ordenado del más reciente al más antiguo: se anexa en orden
+        # cronológico (estable, conserva el orden dentro de cada ejecución)
+        self._append(sorted(articles, key=lambda a: a.get('scraped_at') or ''))
+        return len(articles)
+
+    def _append(self, articles):
+        handles = {}
+        try:
+            for article in articles:
+                segment = self._segment_for(article)
+                if segment['file'] not in handles:
+                    full = os.path.join(self.path, segment['file'])
+                    os.makedirs(os.path.dirname(full), exist_ok=True)
+                    handles[segment['file']] = (open(full, 'a', encoding='utf-8'), segment)
+                line = json.dumps(article, ensure_ascii=False) + '\n'
+                handles[segment['file']][0].write(line)
+                segment['records'] += 1
+                segment['bytes'] += len(line.encode('utf-8'))
+        finally:
+            for handle, _ in handles.values():
+                handle.close()
+        if self._records is not None:
+            for article in articles:
+                if self._key(article):
+                    self._records[self._key(article)] = article
+        self._save_manifest()
+
+    def upsert(self, articles, fields):
+        """Anexa artículos nuevos y los conocidos cuyo contenido cambió.
+
+        Devuelve `(nuevos, refrescados)`, con la misma regla que `save_history`.
+        """
+        records = self.records()
+        hashes = {a.get('hash') for a in records.values()}
+        rows = []
+        new = refreshed = 0
+        for art in articles:
+            old = records.get(art.get('url')) if art.get('url') else None
+            if old is not None:
+                changes = {k: art.get(k) for k in fields if art.get(k) and art.get(k) != old.get(k)}
+                if not changes:
+                    continue
+                # Conserva `scraped_at`: el registro va al segmento del día original
+                # y caduca con él, como en `save_history`
+                refreshed_at = art.get('scraped_at')
+                art = dict(old, **changes)
+                art['refreshed_at'] = refreshed_at
+                refreshed += 1
+            elif not self._key(art) or art.get('hash') in hashes:
+                continue
+            else:
+                new += 1
+                hashes.add(art.get('hash'))
+            rows.append(art)
+        if rows:
+            self._append(rows)
+        return new, refreshed
+
+    def annotate(self, updates):
+        """Aplica `{clave: {campo: valor}}` sin marcar los artículos como refrescados.
+
+        El registro anotado se anexa al segmento de su día original (gana al
+        leer). Devuelve el número de artículos actualizados.
+        """
+        rows = []
+        for key, article in self.get_many(updates).items():
+            changes = {k: v for k, v in updates[key].items() if article.get(k) != v}
+            if changes:
+                rows.append(dict(article, **changes))
+        if rows:
+            self._append(rows)
+        return len(rows)
+
+    def purge(self, days=7):
+        """Retención: borra los segmentos de días anteriores al límite (sin leerlos)."""
+        cutoff = (datetime.now() - timedelta(days=days)).date().isoformat()
+        expired = [s for s in self._manifest if s['day'] < cutoff]
+        if not expired:
+            return 0
+        for segment in expired:
+            try:
+                os.remove(os.path.join(self.path, segment['file']))
+            except OSError:
+                pass
+            directory = os.path.dirname(os.path.join(self.path, segment['file']))
+            if directory != os.path.normpath(self.path) and not os.listdir(directory):
+                os.rmdir(directory)
+        self._manifest = [s for s in self._manifest if s['day'] >= cutoff]
+        self._records = None
+        self._save_manifest()
+        return sum(s['records'] for s in expired)
+
+    def export_json(self, path):
+        """Snapshot en el formato de `noticias_completas.json` (lista, indent=2), en streaming."""
+        count = 0
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for art in self.iter_recent():
+                item = json.dumps(art, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+                f.write(('[\n  ' if count == 0 else ',\n  ') + item)
+                count += 1
+            f.write('\n]' if count else '[]')
+        os.replace(tmp, path)
+        return count
@@ -0,0 +1,37 @@
+import re
+
+# Ventana inicial del documento donde buscar la declaración <meta charset>
+_META_WINDOW = 4096
+
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+
+class EncodingUtils:
+    @staticmethod
+    def from_headers(headers):
+        """Charset declarado en `Content-Type` (sin el ISO-8859-1 implícito de requests)."""
+        content_type = (headers or {}).get('Content-Type', '')
+        match = _HEADER_CHARSET.search(content_type)
+        return match.group(1).lower() if match else None
+
+    @staticmethod
+    def from_meta(content):
+        """Charset de `<meta charset>` / `http-equiv` en los primeros bytes del HTML."""
+        match = _META_CHARSET.search(content[:_META_WINDOW])
+        return match.group(1).decode('ascii', 'ignore').lower() if match else None
+
+    @staticmethod
+    def resolve(resp):
+        """Devuelve `(encoding, origen)` para pasar los bytes de `resp` al parser.
+
+        Orden: cabecera HTTP → `<meta charset>` → 'utf-8' (BeautifulSoup prueba
+        otras codificaciones si el documento no es UTF-8 válido).
+        """
+        encoding = EncodingUtils.from_headers(resp.headers)
+        if encoding:
+            return encoding, 'header'
+        encoding = EncodingUtils.from_meta(resp.content)
+        if encoding:
+            return encoding, 'meta'
+        return 'utf-8', 'default'
@@ -0,0 +1,78 @@
+import asyncio
+import os
+import resource
+import sys
+
+
+class ProcessUtils:
+    @staticmethod
+    def _children_map():
+        """`{ppid: [pid, ...]}` a partir de `/proc/<pid>/stat` (solo Linux)."""
+        children = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'rb') as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # El nombre del proceso va entre paréntesis y puede contener espacios
+            fields = stat[stat.rfind(b')') + 2:].split()
+            children.setdefault(int(fields[1]), []).append(int(entry))
+        return children
+
+    @staticmethod
+    def tree_rss_mb(pid=None):
+        """RSS en MB del proceso y todos sus descendientes (p. ej. Chromium y sus renderers).
+
+        Fuera de Linux devuelve el pico de RSS del propio proceso (`ru_maxrss`).
+        """
+        pid = pid or os.getpid()
+        if not os.path.isdir('/proc'):
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # macOS lo da en bytes, Linux en KB
+            return maxrss / (1024 * 1024) if sys.platform == 'darwin' else maxrss / 1024
+        children = ProcessUtils._children_map()
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        total = 0
+        pending = [pid]
+        while pending:
+            current = pending.pop()
+            pending.extend(children.get(current, ()))
+            try:
+                with open(f'/proc/{current}/statm', 'rb') as f:
+                    total += int(f.read().split()[1]) * page_size
+            except (OSError, IndexError, ValueError):
+                continue
+        return total / (1024 * 1024)
+
+
+class PeakRSSMonitor:
+    """Muestrea `ProcessUtils.tree_rss_mb()` en segundo plano y guarda el pico."""
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._task = None
+
+    def sample(self):
+        self.peak_mb = max(self.peak_mb, ProcessUtils.tree_rss_mb())
+        return self.peak_mb
+
+    async def _run(self):
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self.sample()
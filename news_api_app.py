@@ -1,3 +1,5 @@
+import os
+
 from flask import Flask, jsonify, request
 from Newspapers.api_abc import ABCScraper
 from Newspapers.api_elmundo import ElMundoScraper
@@ -9,6 +11,12 @@ from Newspapers.api_lavanguardia import LaVanguardiaScraper
 from Newspapers.api_elespanol import ElEspanolScraper
 from Newspapers.api_20minutos import VeinteMinutosScraper
 from Newspapers.api_lavozdegalicia import LaVozDeGaliciaScraper
+from Flask_App.Response_Cache import ResponseCache
+from Flask_App.Single_Flight import SingleFlight
+from Flask_App.Article_Index import ArticleIndex
+from Scraper.Base_Scraper import ARTICLE_FIELDS
+from Storage.Article_Store import SQLiteArticleStore
+from Storage.Segment_Store import SegmentArticleStore
 
 SCRAPERS = {
     'abc.es': ABCScraper(),
@@ -25,49 +33,184 @@ SCRAPERS = {
 
 app = Flask(__name__)
 
+# Caché de respuestas de /scrape: TTL por dominio (segundos); pasado el TTL se
+# sirve la copia anterior mientras se refresca en segundo plano
+CACHE_TTLS = {
+    'elpais.com': 120,
+    'elmundo.es': 120,
+    'abc.es': 120,
+    'eldiario.es': 180,
+    '20minutos.es': 180,
+    'lavanguardia.com': 300,
+    'larazon.es': 300,
+    'publico.es': 300,
+    'elespanol.com': 300,
+    'lavozdegalicia.es': 600
+}
+RESPONSE_CACHE = ResponseCache(default_ttl=300, ttls=CACHE_TTLS, stale_ttl=3600,
+                               max_bytes=64 * 1024 * 1024)
+# Scrapes en curso por URL normalizada: las peticiones simultáneas comparten uno
+SCRAPE_FLIGHTS = SingleFlight()
+
+
+def build_article_index():
+    """Índice de `/articles` sobre el histórico de `scraper_cron.py`.
+
+    `NEWS_STORE` elige el origen igual que `scraper_cron.py --store`
+    (json | sqlite | segments) y `NEWS_STORE_PATH` su ruta.
+    """
+    kind = os.environ.get('NEWS_STORE', 'json')
+    if kind == 'sqlite':
+        path = os.environ.get('NEWS_STORE_PATH', 'noticias.db')
+        return ArticleIndex.from_store(lambda: SQLiteArticleStore(path), [path, path + '-wal'])
+    if kind == 'segments':
+        path = os.environ.get('NEWS_STORE_PATH', 'noticias')
+        return ArticleIndex.from_store(lambda: SegmentArticleStore(path),
+                                       [os.path.join(path, 'manifest.json')])
+    return ArticleIndex.from_json(os.environ.get('NEWS_STORE_PATH', 'noticias_completas.json'))
+
+
+ARTICLE_INDEX = build_article_index()
+
+
+def find_scraper(url):
+    """`(dominio, scraper)` que atiende `url`, o `(None, None)`."""
+    for domain, scraper in SCRAPERS.items():
+        if domain in url.lower():
+            return domain, scraper
+    return None, None
+
+
+def build_detail_article(scraper, url):
+    """Artículo único a partir de la página de detalle `url` (cuando no es una portada)."""
+    details = scraper.scrape_article_details(url)
+    # Crear id determinístico a partir de la URL del artículo (MD5 + base62)
+    date_str = scraper.date.normalizedatetime()
+    article_id = scraper.idgen.generate_id_from_url(url)
+    return scraper.article.create_ordered_article(
+        scraper.name,
+        article_id,
+        date_str,
+        details.get('tags', []),
+        details.get('title', ''),
+        details.get('subtitle', ''),
+        url,
+        details.get('author', 'Redacción'),
+        details.get('image', {'url': '', 'credits': ''}),
+        details.get('body', '')
+    )
+
+
+def run_scrape(scraper, url, fields=None):
+    """Portada + `enrich_article` de cada artículo (o detalle directo) → `(payload, estado)`.
+
+    Con `fields` solo se devuelven esos campos y, si la tarjeta de portada los
+    cubre (`scraper.list_fields`), no se descarga ningún artículo.
+    """
+    if fields and not scraper.needs_details(fields):
+        results = scraper.scrape_list_page(url, fields)
+        if results:
+            return results, 200
+
+    avoided = scraper.stats.get('duplicate_fetches_avoided', 0)
+    with scraper.run_scope():
+        results = scraper.scrape_list_page(url)
+        # Si no hay resultados (posible URL de artículo), intentar obtener detalles directos
+        if not results:
+            try:
+                return [scraper.project(build_detail_article(scraper, url), fields or ARTICLE_FIELDS)], 200
+            except Exception as e:
+                return {'error': 'No se encontraron artículos y falló extracción de detalle', 'message': str(e)}, 500
+
+        # Enriquecer todos los artículos antes de devolver
+        enriched = []
+        for art in results:
+            try:
+                enriched.append(scraper.enrich_article(art))
+            except Exception:
+                enriched.append(art)
+    avoided = scraper.stats.get('duplicate_fetches_avoided', 0) - avoided
+    print(f"♻️ {avoided} descargas duplicadas evitadas")
+    if fields:
+        enriched = [scraper.project(art, fields) for art in enriched]
+    return enriched, 200
+
+
+def stream_scrape(scraper, url, fields=None):
+    """Líneas NDJSON: cada artículo en cuanto sus detalles están listos (ver `iter_list_page`)."""
+    emitted = 0
+    try:
+        if fields and not scraper.needs_details(fields):
+            articles = scraper.scrape_list_page(url, fields)
+        else:
+            articles = scraper.iter_list_page(url)
+        for art in articles:
+            emitted += 1
+            yield app.json.dumps(scraper.project(art, fields) if fields else art) + '\n'
+        if not emitted:
+            art = build_detail_article(scraper, url)
+            yield app.json.dumps(scraper.project(art, fields) if fields else art) + '\n'
+    except Exception as e:
+        yield app.json.dumps({'error': 'Scrape interrumpido', 'message': str(e), 'emitted': emitted}) + '\n'
+
+
+def requested_fields(allowed=None):
+    """Campos de `?fields=a,b,c` (`None` si no se pide proyección).
+
+    Lanza `ValueError` si algún campo no está en `allowed`.
+    """
+    raw = request.args.get('fields')
+    if not raw:
+        return None
+    fields = tuple(dict.fromkeys(f.strip() for f in raw.split(',') if f.strip()))
+    unknown = [f for f in fields if allowed is not None and f not in allowed]
+    if unknown:
+        raise ValueError(f"Campos desconocidos: {', '.join(unknown)}. Disponibles: {', '.join(allowed)}")
+    return fields or None
+
+
+def wants_ndjson():
+    """`?stream=1` o `Accept: application/x-ndjson`."""
+    return (request.args.get('stream') == '1'
+            or request.accept_mimetypes.best == 'application/x-ndjson')
+
+
+def render_scrape(scraper, url, fields=None):
+    """`run_scrape` serializado con el proveedor JSON de Flask → `(cuerpo, estado)`."""
+    payload, status = run_scrape(scraper, url, fields)
+    return app.json.response(payload).get_data(), status
+
+
 @app.route('/scrape', methods=['GET'])
 def scrape():
     url = request.args.get('url')
     if not url:
         return jsonify({'error': 'Requiere parámetro url'}), 400
 
-    # Enriquecer detalles en cada artículo: siempre
+    try:
+        fields = requested_fields(ARTICLE_FIELDS)
+    except ValueError as e:
+        return jsonify({'error': 'Parámetro fields inválido', 'message': str(e)}), 400
 
-    for domain, scraper in SCRAPERS.items():
-        if domain in url.lower():
-            print(f"🔍 {domain}: {url}")
-            results = scraper.scrape_list_page(url)
-            # Si no hay resultados (posible URL de artículo), intentar obtener detalles directos
-            if not results:
-                try:
-                    details = scraper.scrape_article_details(url)
-                    # Crear id determinístico a partir de la URL del artículo (MD5 + base62)
-                    date_str = scraper.date.normalizedatetime()
-                    article_id = scraper.idgen.generate_id_from_url(url)
-                    ordered = scraper.article.create_ordered_article(
-                        scraper.name,
-                        article_id,
-                        date_str,
-                        details.get('tags', []),
-                        details.get('title', ''),
-                        details.get('subtitle', ''),
-                        url,
-                        details.get('author', 'Redacción'),
-                        details.get('image', {'url': '', 'credits': ''}),
-                        details.get('body', '')
-                    )
-                    return jsonify([ordered])
-                except Exception as e:
-                    return jsonify({'error': 'No se encontraron artículos y falló extracción de detalle', 'message': str(e)}), 500
-
-            # Enriquecer todos los artículos antes de devolver
-            enriched = []
-            for art in results:
-                try:
-                    enriched.append(scraper.enrich_article(art))
-                except Exception:
-                    enriched.append(art)
-            return jsonify(enriched)
+    domain, scraper = find_scraper(url)
+    if scraper is not None:
+        print(f"🔍 {domain}: {url}")
+        if wants_ndjson():
+            # Streaming en vivo: no pasa por la caché ni por single-flight
+            return app.response_class(stream_scrape(scraper, url, fields), mimetype='application/x-ndjson',
+                                      headers={'X-Cache': 'BYPASS'})
+        key = RESPONSE_CACHE.normalize(url)
+        if fields:
+            key += '#fields=' + ','.join(sorted(fields))
+        body, status, age, state = RESPONSE_CACHE.fetch(
+            key, lambda: SCRAPE_FLIGHTS.do(key, lambda: render_scrape(scraper, url, fields))[0], domain
+        )
+        response = app.response_class(body, status=status, mimetype=app.json.mimetype)
+        ttl = RESPONSE_CACHE.ttl_for(domain)
+        response.headers['Age'] = str(int(age))
+        response.headers['X-Cache'] = state
+        response.headers['Cache-Control'] = f'public, max-age={max(0, int(ttl - age))}'
+        return response
     
     return jsonify({
         'error': 'Periódico no soportado',
@@ -87,12 +230,43 @@ def scrape():
     }), 400
 
 
+@app.route('/articles', methods=['GET'])
+def articles():
+    """Histórico de 7 días paginado con cursor.
+
+    Filtros: `domain`, `tag`, `author`, `from`/`to` (ISO, sobre `scraped_at`),
+    `dedup=1` (oculta casi duplicados). Paginación: `limit` (máx. 200) y
+    `cursor` (el `next_cursor` de la página anterior). `fields=a,b` proyecta.
+    """
+    args = request.args
+    try:
+        fields = requested_fields()
+        page, next_cursor = ARTICLE_INDEX.query(
+            domain=args.get('domain'),
+            tag=args.get('tag'),
+            author=args.get('author'),
+            since=args.get('from'),
+            until=args.get('to'),
+            cursor=args.get('cursor'),
+            limit=args.get('limit', 50),
+            dedup=args.get('dedup') == '1'
+        )
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': 'Parámetros inválidos', 'message': str(e)}), 400
+    if fields:
+        page = [{k: v for k, v in art.items() if k in fields} for art in page]
+    return jsonify({'articles': page, 'count': len(page), 'next_cursor': next_cursor})
+
+
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({
         'status': 'OK',
         'total': len(SCRAPERS),
-        'periódicos': list(SCRAPERS.keys())
+        'periódicos': list(SCRAPERS.keys()),
+        'cache': RESPONSE_CACHE.stats(),
+        'single_flight': SCRAPE_FLIGHTS.stats(),
+        'articles_index': ARTICLE_INDEX.stats()
     })
 
 if __name__ == '__main__':
@@ -9,10 +9,23 @@ from Newspapers.api_elespanol import ElEspanolScraper
 from Newspapers.api_20minutos import VeinteMinutosScraper
 from Newspapers.api_lavozdegalicia import LaVozDeGaliciaScraper
 
+from Http_Client.http_client import NewsHTTPClient
+from Http_Client.async_http_client import AsyncNewsHTTPClient
+from Scraper.Async_Scraper import AsyncNewsScraper
+from Scraper.Base_Scraper import DETAIL_FIELDS
+from Storage.Article_Store import SQLiteArticleStore
+from Storage.Segment_Store import SegmentArticleStore
+from Analysis.Near_Duplicates import link_near_duplicates
+from Analysis.Story_Clusters import StoryClusterer
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import json
 import hashlib
 from datetime import datetime, timedelta
 import time
+import os
+import argparse
 
 SCRAPERS = {
     'abc.es': ABCScraper(),
@@ -40,79 +53,408 @@ URLS = {
     '20minutos.es': 'https://www.20minutos.es'
 }
 
-def scrape_all():
-    """10 periódicos → dedup → histórico 7 días → JSON único"""
+# Cortesía por dominio (peticiones/segundo, ráfaga). Solo espacia peticiones al mismo host.
+RATE_LIMITS = {
+    'abc.es': (2.0, 2),
+    'elmundo.es': (2.0, 2),
+    'eldiario.es': (2.0, 2),
+    'elpais.com': (2.0, 2),
+    'larazon.es': (1.0, 2),
+    'publico.es': (2.0, 2),
+    'lavanguardia.com': (2.0, 2),
+    'elespanol.com': (1.0, 2),
+    'lavozdegalicia.es': (1.0, 2),
+    '20minutos.es': (2.0, 2)
+}
+
+for _domain, (_rate, _burst) in RATE_LIMITS.items():
+    NewsHTTPClient.shared().limiter.configure(_domain, _rate, _burst)
+
+# Caché HTTP en disco (opt-in): portadas 15 min, artículos 3 días
+if os.environ.get('NEWS_HTTP_CACHE_DIR'):
+    NewsHTTPClient.shared().enable_cache(
+        os.environ['NEWS_HTTP_CACHE_DIR'],
+        max_bytes=int(os.environ.get('NEWS_HTTP_CACHE_MAX_MB', '200')) * 1024 * 1024
+    )
+
+HISTORY_FILE = 'noticias_completas.json'
+DB_FILE = 'noticias.db'
+SEGMENTS_DIR = 'noticias'
+# Análisis opcionales sobre el histórico (`None` = desactivado, por defecto): leen
+# la ventana retenida completa, así que su coste crece con el histórico y no solo
+# con los artículos nuevos. Se activan con --near-dup-threshold / --story-threshold.
+# Similitud SimHash mínima para enlazar un artículo con su canónico (p. ej. 0.9)
+NEAR_DUP_THRESHOLD = None
+# Similitud coseno TF-IDF mínima para agrupar artículos en una historia (p. ej. 0.35)
+STORY_THRESHOLD = None
+STORIES_FILE = 'historias.json'
+# Campos del histórico que leen el índice LSH de casi duplicados y las historias
+NEAR_DUP_FIELDS = ('id', 'url', 'domain', 'simhash', 'duplicate_of')
+TEXT_FIELDS = ('title', 'subtitle', 'body')
+STORY_FIELDS = ('id', 'url', 'story_id', 'scraped_at', 'newspaper', 'domain') + TEXT_FIELDS
+
+def load_history():
+    """Histórico de 7 días (lista de artículos) o lista vacía."""
+    try:
+        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+            old_articles = json.load(f)
+        print(f"📂 Histórico: {len(old_articles)} artículos")
+    except:
+        old_articles = []
+    return old_articles
+
+
+def build_known_index(old_articles, refresh_hours=None):
+    """Índice dominio → {url: detalles} de artículos que no hace falta volver a descargar.
+
+    Con `refresh_hours`, los artículos guardados (o refrescados) hace más de
+    N horas quedan fuera del índice y se vuelven a enriquecer.
+    """
+    cutoff = datetime.now() - timedelta(hours=refresh_hours) if refresh_hours else None
+    known = {}
+    for art in old_articles:
+        url = art.get('url')
+        if not url:
+            continue
+        if cutoff is not None:
+            try:
+                seen_at = datetime.fromisoformat((art.get('refreshed_at') or art['scraped_at']).replace('Z', '+00:00'))
+            except:
+                continue
+            if seen_at < cutoff:
+                continue
+        known.setdefault(art.get('domain', ''), {})[url] = {k: art.get(k) for k in DETAIL_FIELDS}
+    return known
+
+
+def open_store(kind, path=None, per_newspaper=False):
+    """Almacén del histórico: `None` para el JSON clásico, SQLite o segmentos JSONL."""
+    if kind == 'sqlite':
+        store = SQLiteArticleStore(path or DB_FILE)
+    elif kind == 'segments':
+        store = SegmentArticleStore(path or SEGMENTS_DIR, per_newspaper=per_newspaper)
+    else:
+        return None
+    imported = store.import_json(HISTORY_FILE)
+    if imported:
+        print(f"📥 Importados {imported} artículos de {HISTORY_FILE} → {store.path}")
+    return store
+
+
+def prepare_history(store=None, refresh_hours=None):
+    """`(old_articles, known)` para la ejecución.
+
+    Con JSON se carga el histórico completo; con un almacén los artículos
+    conocidos se consultan bajo demanda y `old_articles` es `None`.
+    """
+    if store is None:
+        old_articles = load_history()
+        return old_articles, build_known_index(old_articles, refresh_hours)
+    print(f"🗄️ Histórico: {store.count()} artículos ({store.path})")
+    return None, {d: store.known(d, DETAIL_FIELDS, refresh_hours) for d in SCRAPERS}
+
+
+def build_fallback_article(scraper, url, details):
+    """Artículo único a partir de los detalles de `url` (cuando la portada no devuelve lista)."""
+    date_str = getattr(scraper, 'date', type('Date', (), {'normalizedatetime': lambda: ''})()).normalizedatetime()
+    article_id = getattr(scraper, 'idgen', type('IDGen', (), {'generate_id_from_url': lambda x: 'id'})()).generate_id_from_url(url)
+    return getattr(scraper, 'article', type('Article', (), {'create_ordered_article': lambda *a: {}})()).create_ordered_article(
+        scraper.name, article_id, date_str,
+        details.get('tags', []), details.get('title', ''),
+        details.get('subtitle', ''), url,
+        details.get('author', 'Redacción'),
+        details.get('image', {'url': '', 'credits': ''}),
+        details.get('body', '')
+    )
+
+
+def annotate_articles(enriched, domain, scraper, scraped_at=None):
+    """Metadatos + hash dedup"""
+    scraped_at = scraped_at or datetime.now().isoformat()
+    for art in enriched:
+        content_hash = hashlib.md5(
+            f"{art.get('title', '')}{art.get('url', '')}".encode('utf-8')
+        ).hexdigest()
+
+        art['hash'] = content_hash
+        art['domain'] = domain
+        art['newspaper'] = getattr(scraper, 'name', domain)
+        art['scraped_at'] = scraped_at
+    return enriched
+
+
+def scrape_domain(domain, scraper, known=None, scraped_at=None):
+    """Pipeline de un periódico: portada → (fallback) → enriquecer → metadatos.
+
+    `known` ({url: detalles}) son artículos del histórico: no se descargan.
+    `scraped_at` permite sellar toda la ejecución con la misma marca de tiempo.
+    """
+    url = URLS.get(domain, f'https://www.{domain}')
+
+    # Memo por ejecución: la lista y `enrich_article` comparten cada descarga
+    with scraper.run_scope(known):
+        results = scraper.scrape_list_page(url)
+
+        # Fallback artículo individual
+        if not results:
+            try:
+                results = [build_fallback_article(scraper, url, scraper.scrape_article_details(url))]
+            except:
+                print(f"   ❌ Fallback falló")
+                return None
+
+        # Enriquecer (tu lógica original)
+        enriched = []
+        for art in results:
+            try:
+                enriched.append(scraper.enrich_article(art))
+            except:
+                enriched.append(art)
+
+    return annotate_articles(enriched, domain, scraper, scraped_at)
+
+
+async def scrape_domain_async(domain, scraper, client, known=None, scraped_at=None):
+    """Igual que `scrape_domain` pero con los detalles descargados en paralelo."""
+    url = URLS.get(domain, f'https://www.{domain}')
+    runner = AsyncNewsScraper(scraper, client)
+
+    with scraper.run_scope(known):
+        enriched = await runner.scrape_and_enrich(url)
+
+        # Fallback artículo individual
+        if not enriched:
+            try:
+                details = await runner.scrape_article_details(url)
+                enriched = [build_fallback_article(scraper, url, details)]
+            except:
+                print(f"   ❌ {domain}: fallback falló")
+                return None
+
+    return annotate_articles(enriched, domain, scraper, scraped_at)
+
+
+def scrape_domain_isolated(domain, scraper, known=None, timeout=None, scraped_at=None):
+    """`scrape_domain` en un worker: devuelve `(artículos, error)` sin propagar excepciones.
+
+    Con `timeout` (segundos) el periódico se abandona al agotar el plazo y
+    sus resultados parciales se descartan.
+    """
+    started = time.monotonic()
+    try:
+        with scraper.deadline(timeout):
+            enriched = scrape_domain(domain, scraper, known, scraped_at)
+            if scraper.deadline_exceeded():
+                raise TimeoutError(f"plazo de {timeout}s agotado")
+        return enriched, None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e} ({time.monotonic() - started:.1f}s)"
+
+
+def scrape_all_parallel(known, workers, domain_timeout=None, scraped_at=None):
+    """Un worker por periódico; resultados fusionados en el orden de SCRAPERS.
+
+    Con la misma `scraped_at` para toda la ejecución, el orden final (estable)
+    coincide con el de una ejecución secuencial.
+    """
+    print(f"⚡ Modo paralelo: {workers} workers, plazo por periódico: {domain_timeout or '∞'}s")
+    domains = list(SCRAPERS.keys())
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scraper') as pool:
+        futures = [pool.submit(scrape_domain_isolated, d, SCRAPERS[d], known.get(d),
+                               domain_timeout, scraped_at)
+                   for d in domains]
+        outcomes = [f.result() for f in futures]
+
+    all_articles = []
+    for domain, (enriched, error) in zip(domains, outcomes):
+        if error:
+            print(f"   ❌ {domain}: {error[:80]}")
+            continue
+        if enriched is None:
+            continue
+        all_articles.extend(enriched)
+        print(f"   ✅ {domain}: +{len(enriched)} → {len(all_articles)} total")
+    return all_articles
+
+
+def scrape_all(refresh_hours=None, workers=1, domain_timeout=None, store=None, snapshot=True):
+    """10 periódicos → dedup → histórico 7 días → JSON único
+
+    Con `workers > 1` cada periódico corre en su propio hilo (ver
+    `scrape_all_parallel`); el JSON resultante es el mismo que en secuencial.
+    Con `store` (ver `open_store`) el histórico vive en SQLite o en segmentos
+    JSONL y el JSON es un snapshot exportado (omitible con `snapshot=False`).
+    """
     print("🚀 INICIO SCRAPING - 10 PERIÓDICOS")
     all_articles = []
+
+    # 📂 Histórico primero: los artículos ya conocidos no se vuelven a descargar
+    old_articles, known = prepare_history(store, refresh_hours)
+    # Una única marca de tiempo por ejecución: orden determinista en el JSON
+    scraped_at = datetime.now().isoformat()
+
+    if workers > 1:
+        all_articles = scrape_all_parallel(known, workers, domain_timeout, scraped_at)
+        return persist(all_articles, old_articles, store, snapshot)
     
     # 🔍 Scraping por periódico
     for domain, scraper in SCRAPERS.items():
         url = URLS.get(domain, f'https://www.{domain}')
         print(f"\n🔍 [{len(all_articles)} total] {domain}: {url}")
         
-        try:
-            time.sleep(2)  # Anti-ban
-            
-            results = scraper.scrape_list_page(url)
-            
-            # Fallback artículo individual
-            if not results:
-                try:
-                    details = scraper.scrape_article_details(url)
-                    date_str = getattr(scraper, 'date', type('Date', (), {'normalizedatetime': lambda: ''})()).normalizedatetime()
-                    article_id = getattr(scraper, 'idgen', type('IDGen', (), {'generate_id_from_url': lambda x: 'id'})()).generate_id_from_url(url)
-                    ordered = getattr(scraper, 'article', type('Article', (), {'create_ordered_article': lambda *a: {}})()).create_ordered_article(
-                        scraper.name, article_id, date_str,
-                        details.get('tags', []), details.get('title', ''),
-                        details.get('subtitle', ''), url,
-                        details.get('author', 'Redacción'),
-                        details.get('image', {'url': '', 'credits': ''}),
-                        details.get('body', '')
-                    )
-                    results = [ordered]
-                except:
-                    print(f"   ❌ Fallback falló")
-                    continue
-            
-            # Enriquecer (tu lógica original)
-            enriched = []
-            for art in results:
-                try:
-                    enriched.append(scraper.enrich_article(art))
-                except:
-                    enriched.append(art)
-            
-            # Metadatos + hash dedup
-            for art in enriched:
-                content_hash = hashlib.md5(
-                    f"{art.get('title', '')}{art.get('url', '')}".encode('utf-8')
-                ).hexdigest()
-                
-                art['hash'] = content_hash
-                art['domain'] = domain
-                art['newspaper'] = getattr(scraper, 'name', domain)
-                art['scraped_at'] = datetime.now().isoformat()
-            
-            all_articles.extend(enriched)
-            print(f"   ✅ +{len(enriched)} → {len(all_articles)} total")
-            
-        except Exception as e:
-            print(f"   ❌ {str(e)[:80]}")
+        enriched, error = scrape_domain_isolated(domain, scraper, known.get(domain),
+                                                 domain_timeout, scraped_at)
+        if error:
+            print(f"   ❌ {error[:80]}")
+            continue
+        if enriched is None:
+            continue
+        all_articles.extend(enriched)
+        print(f"   ✅ +{len(enriched)} → {len(all_articles)} total")
     
+    return persist(all_articles, old_articles, store, snapshot)
+
+
+async def scrape_all_async(global_limit=16, per_domain_limit=4, refresh_hours=None, store=None,
+                           snapshot=True):
+    """Como `scrape_all`, pero los 10 periódicos y sus artículos se descargan concurrentemente."""
+    print("🚀 INICIO SCRAPING ASYNC - 10 PERIÓDICOS")
+    old_articles, known = prepare_history(store, refresh_hours)
+    scraped_at = datetime.now().isoformat()
+    client = AsyncNewsHTTPClient(global_limit=global_limit, per_domain_limit=per_domain_limit)
+    started = time.monotonic()
+    try:
+        domains = list(SCRAPERS.keys())
+        outcomes = await asyncio.gather(
+            *(scrape_domain_async(d, SCRAPERS[d], client, known.get(d), scraped_at) for d in domains),
+            return_exceptions=True
+        )
+    finally:
+        client.close()
+
+    # Fusionar en el orden de SCRAPERS (determinista)
+    all_articles = []
+    for domain, outcome in zip(domains, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"   ❌ {domain}: {str(outcome)[:80]}")
+            continue
+        if outcome is None:
+            continue
+        all_articles.extend(outcome)
+        print(f"   ✅ {domain}: +{len(outcome)} → {len(all_articles)} total")
+    print(f"⏱️ Descarga: {time.monotonic() - started:.1f}s")
+
+    return persist(all_articles, old_articles, store, snapshot)
+
+
+def persist(all_articles, old_articles=None, store=None, snapshot=True):
+    """Guarda la ejecución en el JSON clásico o en un almacén (SQLite o segmentos)."""
+    history = []
+    # Anotaciones calculadas sobre el histórico que hay que guardar: {url: {campo: valor}}
+    updates = {}
+    if NEAR_DUP_THRESHOLD or STORY_THRESHOLD:
+        if store is None:
+            if old_articles is None:
+                old_articles = load_history()
+            history = old_articles
+        else:
+            # Del almacén solo se leen los campos que usan el LSH y las historias
+            fields = NEAR_DUP_FIELDS + (STORY_FIELDS if STORY_THRESHOLD else ())
+            history = list(store.iter_recent(tuple(dict.fromkeys(fields))))
+
+    if NEAR_DUP_THRESHOLD:
+        started = time.monotonic()
+        # Huellas que faltan en el histórico (p. ej. importado): se calculan una vez y se guardan
+        missing = [a for a in history if a.get('simhash') is None and a.get('url')]
+        if store is not None and missing and not STORY_THRESHOLD:
+            texts = store.get_many([a['url'] for a in missing], TEXT_FIELDS)
+            for art in missing:
+                art.update(texts.get(art['url'], {}))
+        linked = link_near_duplicates(all_articles, history, NEAR_DUP_THRESHOLD)
+        for art in missing:
+            updates.setdefault(art['url'], {})['simhash'] = art['simhash']
+        print(f"🪞 Casi duplicados: {linked} enlazados a su canónico "
+              f"(umbral {NEAR_DUP_THRESHOLD}, {len(missing)} huellas nuevas en el histórico, "
+              f"{time.monotonic() - started:.2f}s)")
+
+    if STORY_THRESHOLD:
+        # Ventana de 7 días + artículos nuevos de esta ejecución
+        cutoff = (datetime.now() - timedelta(days=7)).isoformat()
+        known_urls = {a.get('url') for a in history}
+        window = [a for a in history if (a.get('scraped_at') or '') >= cutoff]
+        # Artículos del histórico aún sin historia (p. ej. importados): su `story_id` se guarda
+        unassigned = [a for a in window if not a.get('story_id') and a.get('url')]
+        window += [a for a in all_articles if a.get('url') not in known_urls]
+        clusterer = StoryClusterer(STORY_THRESHOLD)
+        started = time.monotonic()
+        assigned = clusterer.assign(window)
+        for art in unassigned:
+            updates.setdefault(art['url'], {})['story_id'] = art['story_id']
+        print(f"🧵 Historias: {assigned} artículos asignados ({time.monotonic() - started:.2f}s)")
+
+    if store is None:
+        result = save_history(all_articles, old_articles)
+    else:
+        result = save_to_store(store, all_articles, snapshot, updates)
+
+    if STORY_THRESHOLD:
+        stories = clusterer.write_stories(window, STORIES_FILE)
+        print(f"   🧵 {STORIES_FILE} → {len(stories)} historias con ≥2 artículos")
+    return result
+
+
+def save_to_store(store, all_articles, snapshot=True, updates=None):
+    """Upsert por lotes, anotaciones del histórico, retención y snapshot JSON.
+
+    `updates` ({url: {campo: valor}}) son campos derivados del histórico
+    (`simhash`, `story_id`) que se guardan sin marcar el artículo como refrescado.
+    """
+    print(f"\n📊 BRUTO: {len(all_articles)} artículos")
+    new, refreshed = store.upsert(all_articles, DETAIL_FIELDS + ('hash',))
+    print(f"➕ Nuevos únicos: {new} | 🔁 Refrescados: {refreshed}")
+    deleted = store.purge(days=7)
+    print(f"🗑️ Eliminados: {deleted} (>7 días)")
+    if updates:
+        print(f"🏷️ Anotados en el histórico: {store.annotate(updates)}")
+
+    if snapshot:
+        total = store.export_json(HISTORY_FILE)
+        print(f"\n🎉 FINAL: {total} noticias (7 días)")
+        print(f"   📁 {HISTORY_FILE} → {os.path.getsize(HISTORY_FILE) / 1024:.1f}KB (snapshot de {store.path})")
+    else:
+        total = store.count()
+        print(f"\n🎉 FINAL: {total} noticias (7 días) en {store.path}")
+    print(f"   🏆 Top: {store.top_domains()}")
+    print_run_stats()
+    return total
+
+
+def save_history(all_articles, old_articles=None):
+    """Fusiona con el histórico, aplica retención de 7 días y escribe el JSON."""
     print(f"\n📊 BRUTO: {len(all_articles)} artículos")
     
-    # 📂 CARGAR HISTÓRICO ANTERIOR
-    try:
-        with open('noticias_completas.json', 'r', encoding='utf-8') as f:
-            old_articles = json.load(f)
-        print(f"📂 Histórico: {len(old_articles)} artículos")
-    except:
-        old_articles = []
+    # 📂 CARGAR HISTÓRICO ANTERIOR (si no se cargó ya al empezar)
+    if old_articles is None:
+        old_articles = load_history()
     
-    # 🔄 DEDUP: nuevos vs histórico
+    # 🔄 DEDUP: nuevos vs histórico (por URL y por hash)
+    old_by_url = {art.get('url'): art for art in old_articles if art.get('url')}
     old_hashes = {art.get('hash') for art in old_articles}
-    new_articles = [art for art in all_articles if art['hash'] not in old_hashes]
-    print(f"➕ Nuevos únicos: {len(new_articles)}")
+    new_articles = []
+    refreshed = 0
+    for art in all_articles:
+        old = old_by_url.get(art.get('url'))
+        if old is not None:
+            # Artículo conocido: solo se actualiza si el contenido cambió (refresco)
+            changes = {k: art.get(k) for k in DETAIL_FIELDS + ('hash',) if art.get(k) and art.get(k) != old.get(k)}
+            if changes:
+                old.update(changes)
+                old['refreshed_at'] = art.get('scraped_at')
+                refreshed += 1
+            continue
+        if art['hash'] not in old_hashes:
+            new_articles.append(art)
+    print(f"➕ Nuevos únicos: {len(new_articles)} | 🔁 Refrescados: {refreshed}")
     
     all_articles = old_articles + new_articles
     
@@ -137,7 +479,7 @@ def scrape_all():
     recent_articles.sort(key=lambda x: x.get('scraped_at', ''), reverse=True)
     
     # 💾 JSON FINAL (7 días)
-    with open('noticias_completas.json', 'w', encoding='utf-8') as f:
+    with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
         json.dump(recent_articles, f, ensure_ascii=False, indent=2)
     
     # STATS
@@ -148,8 +490,72 @@ def scrape_all():
     for art in recent_articles[:100]:
         domains[art.get('domain', '?')] = domains.get(art.get('domain', '?'), 0) + 1
     print(f"   🏆 Top: {dict(sorted(domains.items(), key=lambda x: x[1], reverse=True)[:5])}")
-    
+    print_run_stats()
+
     return recent_articles
 
+
+def print_run_stats():
+    """Contadores de la ejecución: memo, parseo, JSON-LD, HTTP y caché."""
+    avoided = sum(s.stats.get('duplicate_fetches_avoided', 0) for s in SCRAPERS.values())
+    skipped = sum(s.stats.get('known_articles_skipped', 0) for s in SCRAPERS.values())
+    print(f"   ♻️ Descargas duplicadas evitadas: {avoided} | ya conocidos sin descargar: {skipped}")
+
+    for domain, scraper in SCRAPERS.items():
+        st = scraper.stats
+        if st.get('pages_parsed'):
+            print(f"   ⏱️ {domain}: {st['pages_parsed']} páginas, "
+                  f"charset {st.get('charset_ms', 0):.1f}ms, parseo {st.get('parse_ms', 0):.0f}ms "
+                  f"(cabecera {st.get('encoding_header', 0)} / meta {st.get('encoding_meta', 0)} "
+                  f"/ por defecto {st.get('encoding_default', 0)})")
+        ld_total = st.get('jsonld_full', 0) + st.get('jsonld_partial', 0) + st.get('jsonld_none', 0)
+        if ld_total:
+            print(f"   🧩 {domain}: JSON-LD suficiente en {st.get('jsonld_full', 0)}/{ld_total} artículos "
+                  f"(parcial {st.get('jsonld_partial', 0)}, sin JSON-LD {st.get('jsonld_none', 0)})")
+
+    http_stats = NewsHTTPClient.shared().stats()
+    print(f"   🔌 HTTP: {http_stats['requests']} peticiones, "
+          f"{http_stats['connections_opened']} conexiones abiertas, "
+          f"{http_stats['connections_reused']} reutilizadas ({http_stats['hosts']} hosts), "
+          f"{http_stats['not_modified']}/{http_stats['conditional_sent']} revalidadas con 304")
+    if NewsHTTPClient.shared().cache is not None:
+        cache_stats = NewsHTTPClient.shared().cache.stats()
+        print(f"   💾 Caché: {cache_stats['hits']} aciertos, {cache_stats['misses']} fallos, "
+              f"{cache_stats['expired']} caducados, {cache_stats['entries']} entradas "
+              f"({cache_stats['bytes'] / 1024 / 1024:.1f}MB)")
+
 if __name__ == '__main__':
-    scrape_all()
+    parser = argparse.ArgumentParser(description='Scraping de portadas → noticias_completas.json')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Descarga concurrente (asyncio)')
+    parser.add_argument('--refresh-hours', type=float, default=None,
+                        help='Re-enriquecer artículos conocidos guardados hace más de N horas')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Periódicos en paralelo (1 = secuencial)')
+    parser.add_argument('--domain-timeout', type=float, default=None,
+                        help='Plazo máximo por periódico en segundos')
+    parser.add_argument('--store', choices=('json', 'sqlite', 'segments'), default='json',
+                        help='Histórico en el JSON completo, en SQLite o en segmentos JSONL por día')
+    parser.add_argument('--db', default=None,
+                        help=f'Ruta de la base SQLite o del directorio de segmentos '
+                             f'(por defecto {DB_FILE} / {SEGMENTS_DIR}/)')
+    parser.add_argument('--per-newspaper', action='store_true',
+                        help='Un segmento por día y periódico (--store segments)')
+    parser.add_argument('--near-dup-threshold', type=float, default=NEAR_DUP_THRESHOLD,
+                        help='Marcar casi duplicados con esta similitud mínima (0-1], p. ej. 0.9; '
+                             'desactivado por defecto')
+    parser.add_argument('--story-threshold', type=float, default=STORY_THRESHOLD,
+                        help=f'Agrupar historias ({STORIES_FILE}) con esta similitud coseno mínima, '
+                             f'p. ej. 0.35; desactivado por defecto')
+    parser.add_argument('--no-snapshot', dest='snapshot', action='store_false',
+                        help=f'No exportar {HISTORY_FILE} (solo con --store sqlite/segments)')
+    args = parser.parse_args()
+
+    NEAR_DUP_THRESHOLD = args.near_dup_threshold
+    STORY_THRESHOLD = args.story_threshold
+    store = open_store(args.store, args.db, args.per_newspaper)
+    if args.use_async:
+        asyncio.run(scrape_all_async(refresh_hours=args.refresh_hours, store=store, snapshot=args.snapshot))
+    else:
+        scrape_all(refresh_hours=args.refresh_hours, workers=args.workers,
+                   domain_timeout=args.domain_timeout, store=store, snapshot=args.snapshot)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Los módulos del repo se importan desde la raíz (`from Browser...`, `import trends_scraper`)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+"""`/articles`: paginación con cursor `(scraped_at, id)` y filtros del índice."""
+from Flask_App.Article_Index import ArticleIndex
+
+RUN_1 = '2026-10-18T09:00:00'
+RUN_2 = '2026-10-18T10:00:00'
+
+
+def article(article_id, scraped_at, domain='elpais.com', tags=(), author='Redacción'):
+    return {'id': article_id, 'scraped_at': scraped_at, 'domain': domain,
+            'tags': list(tags), 'author': author, 'title': article_id}
+
+
+def make_index(articles):
+    current = {'articles': articles}
+    index = ArticleIndex(lambda: list(current['articles']), [], check_interval=0)
+    return index, current
+
+
+def ids(page):
+    return [a['id'] for a in page]
+
+
+def paginate(index, **filters):
+    seen, cursor = [], None
+    while True:
+        page, cursor = index.query(cursor=cursor, **filters)
+        seen += ids(page)
+        if cursor is None:
+            return seen
+
+
+def test_pages_follow_scraped_at_then_id():
+    articles = [article(f'a{i:02d}', RUN_1) for i in range(7)] + [article('b00', RUN_2)]
+    index, _ = make_index(articles)
+
+    assert paginate(index, limit=3) == ['b00'] + [f'a{i:02d}' for i in reversed(range(7))]
+
+
+def test_missing_cursor_article_resumes_at_next_key():
+    articles = [article(f'a{i:02d}', RUN_1) for i in range(6)]
+    index, current = make_index(articles)
+
+    page, cursor = index.query(limit=2)
+    assert ids(page) == ['a05', 'a04']
+
+    # El artículo del cursor desaparece entre página y página (p. ej. recarga tras purga)
+    current['articles'] = [a for a in articles if a['id'] != 'a04']
+    index._signature = None
+    page, cursor = index.query(cursor=cursor, limit=10)
+    assert ids(page) == ['a03', 'a02', 'a01', 'a00']
+    assert cursor is None
+
+
+def test_combined_filters():
+    articles = [
+        article('a1', RUN_1, 'elpais.com', ['Política'], 'Ana Pérez'),
+        article('a2', RUN_1, 'abc.es', ['Política'], 'Ana Pérez'),
+        article('a3', RUN_2, 'elpais.com', ['Deportes'], 'Luis Gil y Ana Pérez'),
+        article('a4', RUN_2, 'elpais.com', ['política'], 'Luis Gil'),
+    ]
+    index, _ = make_index(articles)
+
+    assert paginate(index, domain='ELPAIS.com', tag='politica') == ['a4', 'a1']
+    assert paginate(index, domain='elpais.com', author='ana perez') == ['a3', 'a1']
+    assert paginate(index, tag='política', author='Ana Pérez', domain='abc.es') == ['a2']
+    assert paginate(index, domain='elpais.com', tag='cine') == []
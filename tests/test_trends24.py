@@ -0,0 +1,163 @@
+"""trends24: parseo del HTML estático y fallback a Playwright.
+
+`fixtures/trends24_spain.html` reproduce, recortado, el marcado de
+https://trends24.in/spain/ que leen ambas vías (`section.stat-card` >
+`ol.stat-card-list` > `li.stat-card-item` > `a.trend-link`).
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import pytest
+import requests
+
+import trends_scraper
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'trends24_spain.html')
+URL = 'https://trends24.in/spain/'
+SELECTOR1 = 'h2'
+SELECTOR2 = 'section.stat-card'
+BASE_ID = 100
+
+
+@pytest.fixture
+def html():
+    with open(FIXTURE, 'rb') as f:
+        return f.read()
+
+
+class FakePage:
+    """Página mínima para `LoadPlan.open` + `eval_on_selector_all`."""
+
+    def __init__(self, sections):
+        self.sections = sections
+        self.visited = []
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.visited.append(url)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        pass
+
+    async def eval_on_selector_all(self, selector, script):
+        assert selector == SELECTOR2
+        return self.sections
+
+
+class FakePool:
+    def __init__(self, sections):
+        self.page_ = FakePage(sections)
+        self.pages_opened = 0
+
+    @asynccontextmanager
+    async def page(self, **options):
+        self.pages_opened += 1
+        yield self.page_
+
+
+def trends24_from(sections):
+    return trends_scraper.trends24_from_sections(sections, BASE_ID)
+
+
+def scrape(pool):
+    return asyncio.run(trends_scraper.scrape_trends24(pool, URL, SELECTOR1, SELECTOR2, BASE_ID))
+
+
+def test_parse_sections(html):
+    sections = trends_scraper.parse_trends24_html(html, 'utf-8', SELECTOR2)
+
+    # Solo las 3 primeras secciones; la que no tiene lista queda como `None`
+    assert len(sections) == 3
+    assert sections[2] is None
+    assert [item['title'] for item in sections[0]] == ['#ElClásico', 'Sánchez', 'Valencia', None]
+    assert 'longest trending for 14 hrs' in sections[0][0]['text']
+
+
+def test_names_and_ids(html):
+    sections = trends_scraper.parse_trends24_html(html, 'utf-8', SELECTOR2)
+    trends = trends24_from(sections)
+
+    assert [t['title'] for t in trends] == ['#ElClásico', 'Sánchez', 'Valencia',
+                                            '#ElClásico', 'Mbappé', 'Feijóo']
+    # id = base + 10 * sección + posición + 1 (el item sin enlace no se cuenta)
+    assert [t['id'] for t in trends] == [101, 102, 103, 111, 112, 113]
+    assert all(t['source'] == 'x_trends' for t in trends)
+
+
+def test_volume_and_timeframe(html):
+    sections = trends_scraper.parse_trends24_html(html, 'utf-8', SELECTOR2)
+    trends = {t['id']: t for t in trends24_from(sections)}
+
+    # Sección "Longest Trending": horas en tendencia, sin volumen
+    assert trends[101]['timeframe'] == '14h trending'
+    assert trends[103]['timeframe'] == '1h trending'
+    assert trends[101]['volume'] == 'N/A'
+    # Sección "Most Tweeted": volumen con el mismo formato que la vía Playwright
+    assert trends[111]['volume'] == '125KM tweets'
+    assert trends[112]['volume'] == '61.3KM tweets'
+    assert trends[111]['timeframe'] == '24h trends'
+
+
+def test_fetch_http(html, monkeypatch):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = html
+    resp.headers['Content-Type'] = 'text/html; charset=utf-8'
+
+    class Client:
+        def get(self, url):
+            assert url == URL
+            return resp
+
+    monkeypatch.setattr(trends_scraper.NewsHTTPClient, 'shared', lambda: Client())
+    trends = trends_scraper.fetch_trends24_http(URL, SELECTOR2, BASE_ID)
+    assert trends == trends24_from(trends_scraper.parse_trends24_html(html, 'utf-8', SELECTOR2))
+
+
+def test_auto_uses_http_without_browser(html, monkeypatch):
+    expected = trends24_from(trends_scraper.parse_trends24_html(html, 'utf-8', SELECTOR2))
+    monkeypatch.setattr(trends_scraper, 'TRENDS24_MODE', 'auto')
+    monkeypatch.setattr(trends_scraper, 'fetch_trends24_http', lambda *args: expected)
+    pool = FakePool(sections=[])
+
+    trends, path = scrape(pool)
+    assert (trends, path) == (expected, 'http')
+    assert pool.pages_opened == 0
+
+
+def test_auto_falls_back_to_playwright_when_empty(html, monkeypatch):
+    sections = trends_scraper.parse_trends24_html(html, 'utf-8', SELECTOR2)
+    monkeypatch.setattr(trends_scraper, 'TRENDS24_MODE', 'auto')
+    monkeypatch.setattr(trends_scraper, 'fetch_trends24_http', lambda *args: [])
+    pool = FakePool(sections)
+
+    trends, path = scrape(pool)
+    assert path == 'playwright'
+    assert trends == trends24_from(sections)
+    assert pool.pages_opened == 1
+    assert pool.page_.visited == [URL]
+
+
+def test_auto_falls_back_to_playwright_on_error(html, monkeypatch):
+    def fail(*args):
+        raise requests.ConnectionError('sin red')
+
+    sections = trends_scraper.parse_trends24_html(html, 'utf-8', SELECTOR2)
+    monkeypatch.setattr(trends_scraper, 'TRENDS24_MODE', 'auto')
+    monkeypatch.setattr(trends_scraper, 'fetch_trends24_http', fail)
+
+    trends, path = scrape(FakePool(sections))
+    assert path == 'playwright'
+    assert len(trends) == 6
+
+
+def test_http_mode_never_opens_browser(monkeypatch):
+    monkeypatch.setattr(trends_scraper, 'TRENDS24_MODE', 'http')
+    monkeypatch.setattr(trends_scraper, 'fetch_trends24_http', lambda *args: [])
+    pool = FakePool(sections=[])
+
+    assert scrape(pool) == ([], 'http')
+    assert pool.pages_opened == 0
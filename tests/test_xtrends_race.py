@@ -0,0 +1,73 @@
+"""Carrera entre fuentes X (`scrape_xtrends`): ganadora por prioridad de fuente."""
+import asyncio
+
+import pytest
+
+import trends_scraper
+
+
+def trend(source):
+    return [{'id': 1, 'title': source, 'source': 'x_trends', 'volume': 'N/A', 'timeframe': '24h trends'}]
+
+
+@pytest.fixture
+def race(tmp_path, monkeypatch):
+    monkeypatch.setattr(trends_scraper, 'OUTPUT_FILE', str(tmp_path / 'trends.json'))
+    monkeypatch.setattr(trends_scraper, 'XTRENDS_MODE', 'parallel')
+    monkeypatch.setattr(trends_scraper, 'XTRENDS_HEDGE_DELAY', 0)
+
+    def run(trends24, getdaytrends):
+        # trends24 espera a que arranque getdaytrends: ambas terminan en la misma vuelta
+        started = {}
+
+        async def first(*args):
+            await started.setdefault('event', asyncio.Event()).wait()
+            return resolve(trends24)
+
+        async def second(*args):
+            started.setdefault('event', asyncio.Event()).set()
+            await asyncio.sleep(0)
+            return resolve(getdaytrends)
+
+        monkeypatch.setattr(trends_scraper, 'scrape_trends24', first)
+        monkeypatch.setattr(trends_scraper, 'scrape_getdaytrends', second)
+        return asyncio.run(trends_scraper.scrape_xtrends(pool=None))
+
+    return run
+
+
+def resolve(result):
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def test_same_batch_winner_is_first_source(race):
+    xtrends, report = race((trend('trends24'), 'http'), (trend('getdaytrends'), 'playwright'))
+
+    sources = report['xtrends_race']['sources']
+    assert report['xtrends_race']['winner'] == 'trends24'
+    assert report['xtrends_path'] == 'http'
+    assert [t['title'] for t in xtrends] == ['trends24']
+    assert sources['trends24']['status'] == 'won'
+    assert sources['getdaytrends']['status'] == 'late'
+
+
+def test_next_source_wins_when_first_is_empty(race):
+    xtrends, report = race(([], 'http'), (trend('getdaytrends'), 'playwright'))
+
+    sources = report['xtrends_race']['sources']
+    assert report['xtrends_race']['winner'] == 'getdaytrends'
+    assert sources['trends24']['status'] == 'empty'
+    assert sources['getdaytrends']['status'] == 'won'
+    assert report['xtrends_race']['wins'] == {'getdaytrends': 1}
+
+
+def test_all_sources_fail(race):
+    xtrends, report = race(RuntimeError('caída'), ([], 'playwright'))
+
+    sources = report['xtrends_race']['sources']
+    assert xtrends == []
+    assert report['xtrends_race']['winner'] is None
+    assert sources['trends24']['status'] == 'error'
+    assert sources['getdaytrends']['status'] == 'empty'
@@ -5,209 +5,397 @@ IDs: 1-99=Google (24h/4h) | 100+=X Trends
 Campos: id, title, source, volume, timeframe
 """
 
+import argparse
 import json
 from datetime import datetime
 import asyncio
-from playwright.async_api import async_playwright
 import re
+import time
 
+from bs4 import BeautifulSoup
 
-async def scrape_trends(hours):
-    """Scrapea Google Trends"""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
-        page = await context.new_page()
-        
-        url = f"https://trends.google.com/trending?geo=ES&hl=es&sort=search-volume&hours={hours}"
-        await page.goto(url, wait_until='networkidle', timeout=45000)
-        
-        await page.wait_for_selector('table.enOdEe-wZVHld-zg7Cn', timeout=30000)
-        await page.wait_for_selector('tr[data-row-id]', timeout=20000)
+from Browser.Browser_Pool import BrowserPool
+from Browser.Page_Loading import LoadPlan, PageMeter, RequestPolicy
+from Http_Client.http_client import NewsHTTPClient
+from Utils.Encoding_Utils import EncodingUtils
+from Utils.Process_Utils import PeakRSSMonitor
+
+OUTPUT_FILE = 'trends_google&x.json'
+X_VIEWPORT = {'width': 1280, 'height': 720}
+GOOGLE_URL = "https://trends.google.com/trending?geo=ES&hl=es&sort=search-volume&hours={hours}"
+
+# Carga de cada fuente: qué peticiones se abortan y cuándo la página está lista.
+# Solo se lee texto, así que imágenes, fuentes, vídeo y analítica sobran; los
+# scripts de terceros también, salvo los de Google (la tabla se pinta con JS).
+# Ninguna espera a networkidle: basta con domcontentloaded y el selector de
+# filas de cada fuente (en Google, `tr[data-row-id]` ya implica la tabla pintada).
+LOAD_PLANS = {
+    'google': LoadPlan(RequestPolicy(block_third_party_scripts=True,
+                                     first_party=('google.com', 'gstatic.com', 'googleapis.com'))),
+    'trends24': LoadPlan(RequestPolicy(block_third_party_scripts=True)),
+    'getdaytrends': LoadPlan(RequestPolicy(block_third_party_scripts=True)),
+}
+# Extracción en una sola evaluación dentro de la página por fuente: el
+# navegador devuelve todas las filas como datos y Python solo post-procesa
+# (antes eran varias idas y vueltas CDP por fila)
+GOOGLE_ROWS_JS = """rows => rows.slice(0, 15).map(row => {
+    const text = sel => { const el = row.querySelector(sel); return el ? el.innerText : null; };
+    return {title: text('div.mZ3RIc'), volume: text('div.lqv0Cb, div.qNpYPd'), time: text('div.A7jE4')};
+})"""
+TRENDS24_SECTIONS_JS = """sections => sections.slice(0, 3).map(section => {
+    const list = section.querySelector('ol.stat-card-list');
+    if (!list) return null;
+    return Array.from(list.querySelectorAll('li.stat-card-item')).slice(0, 10).map(item => {
+        const link = item.querySelector('a.trend-link');
+        return {title: link ? link.innerText : null, text: item.innerText};
+    });
+})"""
+GETDAYTRENDS_ITEMS_JS = """items => items.slice(0, 25).map(item => {
+    const text = sel => { const el = item.querySelector(sel); return el ? el.innerText : null; };
+    return {title: text('div[data-testid="trend-name"]'), volume: text('[data-testid="tweets"]')};
+})"""
+
+# --no-block vuelve a la carga completa (sin abortar peticiones)
+BLOCKING = True
+# Vía para trends24: 'auto' (HTTP y, si no hay trends, Playwright) | 'http' | 'playwright'
+TRENDS24_MODE = 'auto'
+# Carrera entre fuentes X: 'hedged' (la siguiente arranca tras XTRENDS_HEDGE_DELAY s
+# o cuando falla la anterior) | 'parallel' (todas a la vez) | 'sequential' (una tras otra)
+XTRENDS_MODE = 'hedged'
+XTRENDS_HEDGE_DELAY = 5.0
+
+
+def log_extraction(source, started, rows):
+    print(f"⏱️ Extracción {source}: {(time.perf_counter() - started) * 1000:.0f} ms ({rows} filas)")
+
+
+def load_plan(source):
+    plan = LOAD_PLANS[source]
+    return plan if BLOCKING else plan.without_blocking()
+
+
+async def scrape_trends(pool, hours):
+    """Scrapea Google Trends (una página del navegador compartido)"""
+    async with pool.page() as page:
+        await load_plan('google').open(page, GOOGLE_URL.format(hours=hours), 'tr[data-row-id]')
         
-        rows = await page.query_selector_all('tr[data-row-id]')
+        started = time.perf_counter()
+        rows = await page.eval_on_selector_all('tr[data-row-id]', GOOGLE_ROWS_JS)
+        log_extraction(f"google {hours}h", started, len(rows))
         trends = []
         
         base_id = 1 if hours == '24' else 20  # 1-19=24h, 20-39=4h
         
-        for i, row in enumerate(rows[:15]):
-            try:
-                title_elem = await row.query_selector('div.mZ3RIc')
-                title = await title_elem.inner_text() if title_elem else ''
-                
-                if not title.strip():
-                    continue
-                
-                volume_elem = await row.query_selector('div.lqv0Cb, div.qNpYPd')
-                volume = await volume_elem.inner_text() if volume_elem else '0'
-                
-                time_elem = await row.query_selector('div.A7jE4')
-                time = await time_elem.inner_text() if time_elem else ''
-                
-                trend = {
-                    'id': base_id + i,
-                    'title': title.strip(),
-                    'source': 'google',
-                    'volume': volume.strip(),
-                    'timeframe': f"{time.strip()} ({hours}h)"
-                }
-                trends.append(trend)
-            except:
+        for i, row in enumerate(rows):
+            title = row['title'] or ''
+            if not title.strip():
                 continue
+            
+            volume = row['volume'] if row['volume'] is not None else '0'
+            time_text = row['time'] or ''
+            
+            trend = {
+                'id': base_id + i,
+                'title': title.strip(),
+                'source': 'google',
+                'volume': volume.strip(),
+                'timeframe': f"{time_text.strip()} ({hours}h)"
+            }
+            trends.append(trend)
         
-        await browser.close()
         print(f"Google {hours}h: {len(trends)} trends")
         return trends
 
 
-async def scrape_xtrends():
-    """Scrapea X Trends desde múltiples fuentes (fallback)"""
+async def scrape_google_safe(pool, hours):
+    """`scrape_trends` sin propagar errores: un timeout de una franja no tumba las demás."""
+    try:
+        return await scrape_trends(pool, hours)
+    except Exception as e:
+        print(f"❌ Google {hours}h falló: {str(e)[:100]}")
+        return []
+
+
+def previous_wins():
+    """Victorias acumuladas por fuente X según el último JSON guardado"""
+    try:
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            return dict(json.load(f)['summary']['xtrends_race']['wins'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+async def scrape_xtrends(pool):
+    """Scrapea X Trends desde múltiples fuentes en carrera → `(trends, informe)`.
+
+    La fuente 1 arranca enseguida; cada fuente siguiente arranca cuando la
+    anterior falla o devuelve vacío, o tras `XTRENDS_HEDGE_DELAY` segundos
+    sin respuesta. Gana el primer resultado no vacío y el resto se cancela;
+    si varias terminan en la misma vuelta, gana la de mayor prioridad (la
+    primera de `sources`). Con delay 0 todas corren a la vez; con `None`, una
+    detrás de otra.
+
+    Estado de cada fuente en `informe['xtrends_race']['sources']`:
+    'not_started', 'running', 'error', 'empty' (sin trends), 'won',
+    'late' (devolvió trends en la misma vuelta que la ganadora, pero con menos
+    prioridad; se descartan) o 'cancelled' (seguía corriendo al haber ganadora).
+    """
     sources = [
-        ("https://trends24.in/spain/", 'h2', 'section.stat-card', scrape_trends24),
-        ("https://getdaytrends.com/spain/", '[data-testid="trend"]', None, scrape_getdaytrends),
+        ('trends24', "https://trends24.in/spain/", 'h2', 'section.stat-card', scrape_trends24),
+        ('getdaytrends', "https://getdaytrends.com/spain/", '[data-testid="trend"]', None, scrape_getdaytrends),
     ]
     
     xtrends = []
+    report = {'xtrends_source': None, 'xtrends_path': None}
+    race = {name: {'status': 'not_started', 'latency': None} for name, *_ in sources}
     base_id = 100
     
-    for idx, (url, selector1, selector2, scraper) in enumerate(sources):
+    async def run(idx, url, selector1, selector2, scraper):
+        started = time.perf_counter()
         try:
+            return await scraper(pool, url, selector1, selector2, base_id + (idx * 50))
+        finally:
+            race[sources[idx][0]]['latency'] = round(time.perf_counter() - started, 2)
+    
+    queue = list(enumerate(sources))
+    running = {}
+    winner = None
+    while winner is None and (queue or running):
+        # Arrancar la siguiente fuente (al inicio, tras el delay o tras un fallo)
+        if queue:
+            idx, (name, url, selector1, selector2, scraper) = queue.pop(0)
             print(f"🔄 Probando X Trends fuente {idx+1}: {url}")
-            trends = await scraper(url, selector1, selector2, base_id + (idx * 50))
-            if trends:
-                print(f"✅ X Trends fuente {idx+1}: {len(trends)} trends")
+            race[name]['status'] = 'running'
+            running[asyncio.create_task(run(idx, url, selector1, selector2, scraper))] = (idx, name, url)
+        
+        done, _ = await asyncio.wait(running, timeout=XTRENDS_HEDGE_DELAY if queue else None,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        # Varias pueden terminar a la vez: se resuelven por prioridad de fuente
+        for task in sorted(done, key=lambda t: running[t][0]):
+            idx, name, url = running.pop(task)
+            if task.exception() is not None:
+                race[name]['status'] = 'error'
+                print(f"❌ X Trends fuente {idx+1} falló: {str(task.exception())[:100]}")
+                continue
+            trends, path = task.result()
+            if not trends:
+                race[name]['status'] = 'empty'
+                continue
+            race[name]['status'] = 'won'
+            if winner is None:
+                winner = name
+                print(f"✅ X Trends fuente {idx+1}: {len(trends)} trends (vía {path}, "
+                      f"{race[name]['latency']}s)")
                 xtrends.extend(trends[:20])  # Máximo 20 por fuente
-                break  # Usar primera fuente que funcione
-        except Exception as e:
-            print(f"❌ X Trends fuente {idx+1} falló: {str(e)[:100]}")
-            continue
+                report = {'xtrends_source': url, 'xtrends_path': path}
+            else:
+                race[name]['status'] = 'late'
+    
+    # Usar primera fuente que funcione: las demás se cancelan
+    for task, (idx, name, url) in running.items():
+        task.cancel()
+        race[name]['status'] = 'cancelled'
+    if running:
+        await asyncio.gather(*running, return_exceptions=True)
+        for idx, name, url in running.values():
+            race[name]['latency'] = None
     
     if not xtrends:
         print("⚠️ Todas las fuentes X Trends fallaron - usando fallback")
         # Fallback: trends vacíos pero con estructura correcta
         xtrends = []
     
+    wins = previous_wins()
+    if winner:
+        wins[winner] = wins.get(winner, 0) + 1
+    report['xtrends_race'] = {
+        'mode': XTRENDS_MODE,
+        'hedge_delay': XTRENDS_HEDGE_DELAY,
+        'winner': winner,
+        'sources': race,
+        'wins': wins
+    }
+    
     print(f"X Trends total: {len(xtrends)}")
-    return xtrends
-
-
-async def scrape_trends24(url, selector1, selector2, base_id):
-    """Scraping específico para trends24.in"""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            viewport={'width': 1280, 'height': 720}
-        )
-        page = await context.new_page()
-        
-        await page.goto(url, wait_until='domcontentloaded', timeout=45000)
-        await page.wait_for_selector(selector1, timeout=30000)
-        
-        trends = []
-        sections = await page.query_selector_all(selector2)
+    return xtrends, report
+
+
+def trends24_from_sections(sections, base_id):
+    """Trends de trends24 a partir de las secciones extraídas (navegador o HTML estático)"""
+    trends = []
+    
+    for sec_idx, items in enumerate(sections):  # Máximo 3 secciones
+        if items is None:
+            continue
         
-        for sec_idx, section in enumerate(sections[:3]):  # Máximo 3 secciones
-            try:
-                list_elem = await section.query_selector('ol.stat-card-list')
-                if not list_elem:
-                    continue
-                
-                items = await list_elem.query_selector_all('li.stat-card-item')
-                
-                for i, item in enumerate(items[:10]):
-                    try:
-                        link_elem = await item.query_selector('a.trend-link')
-                        title = await link_elem.inner_text() if link_elem else ''
-                        
-                        if not title.strip():
-                            continue
-                        
-                        item_text = await item.inner_text()
-                        volume = 'N/A'
-                        
-                        match = re.search(r'with ([\d.]+[KMB]?) tweet', item_text, re.IGNORECASE)
-                        if match:
-                            volume = match.group(1) + 'M tweets'
-                        
-                        timeframe = '24h trends'
-                        if 'longest' in item_text.lower():
-                            match_time = re.search(r'for (\d+) hrs?', item_text)
-                            if match_time:
-                                timeframe = f"{match_time.group(1)}h trending"
-                        
-                        trend = {
-                            'id': base_id + (sec_idx * 10) + i + 1,
-                            'title': title.strip(),
-                            'source': 'x_trends',
-                            'volume': volume,
-                            'timeframe': timeframe
-                        }
-                        trends.append(trend)
-                    except:
-                        continue
-            except:
+        for i, item in enumerate(items):
+            title = item['title'] or ''
+            if not title.strip():
                 continue
-        
-        await browser.close()
-        return trends
+            
+            item_text = item['text']
+            volume = 'N/A'
+            
+            match = re.search(r'with ([\d.]+[KMB]?) tweet', item_text, re.IGNORECASE)
+            if match:
+                volume = match.group(1) + 'M tweets'
+            
+            timeframe = '24h trends'
+            if 'longest' in item_text.lower():
+                match_time = re.search(r'for (\d+) hrs?', item_text)
+                if match_time:
+                    timeframe = f"{match_time.group(1)}h trending"
+            
+            trend = {
+                'id': base_id + (sec_idx * 10) + i + 1,
+                'title': title.strip(),
+                'source': 'x_trends',
+                'volume': volume,
+                'timeframe': timeframe
+            }
+            trends.append(trend)
+    
+    return trends
 
 
-async def scrape_getdaytrends(url, selector1, selector2, base_id):
-    """Scraping específico para getdaytrends.com"""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            viewport={'width': 1280, 'height': 720}
-        )
-        page = await context.new_page()
+def parse_trends24_html(content, encoding=None, selector2='section.stat-card'):
+    """Mismas secciones que `TRENDS24_SECTIONS_JS`, desde el HTML estático (BeautifulSoup + lxml)"""
+    soup = BeautifulSoup(content, 'lxml', from_encoding=encoding if isinstance(content, bytes) else None)
+    sections = []
+    for section in soup.select(selector2)[:3]:
+        list_elem = section.select_one('ol.stat-card-list')
+        if list_elem is None:
+            sections.append(None)
+            continue
+        items = []
+        for item in list_elem.select('li.stat-card-item')[:10]:
+            link = item.select_one('a.trend-link')
+            items.append({
+                'title': link.get_text() if link else None,
+                'text': item.get_text(' ')
+            })
+        sections.append(items)
+    return sections
+
+
+def fetch_trends24_http(url, selector2, base_id):
+    """trends24 sin navegador: GET con `NewsHTTPClient` y parseo estático"""
+    resp = NewsHTTPClient.shared().get(url)
+    resp.raise_for_status()
+    started = time.perf_counter()
+    encoding, _ = EncodingUtils.resolve(resp)
+    sections = parse_trends24_html(resp.content, encoding, selector2)
+    log_extraction('trends24 (http)', started, sum(len(items or []) for items in sections))
+    return trends24_from_sections(sections, base_id)
+
+
+async def scrape_trends24(pool, url, selector1, selector2, base_id):
+    """Scraping específico para trends24.in → `(trends, vía)`.
+
+    trends24 sirve las listas en el HTML, así que en modo 'auto' se prueba
+    primero la vía HTTP y solo se arranca una página si no devuelve nada.
+    """
+    if TRENDS24_MODE in ('auto', 'http'):
+        try:
+            trends = await asyncio.to_thread(fetch_trends24_http, url, selector2, base_id)
+            if trends or TRENDS24_MODE == 'http':
+                return trends, 'http'
+            print("⚠️ trends24 (http): HTML sin trends - usando Playwright")
+        except Exception as e:
+            if TRENDS24_MODE == 'http':
+                raise
+            print(f"⚠️ trends24 (http) falló: {str(e)[:100]} - usando Playwright")
+    
+    async with pool.page(viewport=X_VIEWPORT) as page:
+        await load_plan('trends24').open(page, url, selector1)
         
-        await page.goto(url, wait_until='domcontentloaded', timeout=45000)
-        await page.wait_for_selector(selector1, timeout=30000)
+        started = time.perf_counter()
+        sections = await page.eval_on_selector_all(selector2, TRENDS24_SECTIONS_JS)
+        log_extraction('trends24', started, sum(len(items or []) for items in sections))
+        return trends24_from_sections(sections, base_id), 'playwright'
+
+
+async def scrape_getdaytrends(pool, url, selector1, selector2, base_id):
+    """Scraping específico para getdaytrends.com → `(trends, vía)`"""
+    async with pool.page(viewport=X_VIEWPORT) as page:
+        await load_plan('getdaytrends').open(page, url, selector1)
         
+        started = time.perf_counter()
+        items = await page.eval_on_selector_all(selector1, GETDAYTRENDS_ITEMS_JS)
+        log_extraction('getdaytrends', started, len(items))
         trends = []
-        items = await page.query_selector_all(selector1)
         
-        for i, item in enumerate(items[:25]):
-            try:
-                title_elem = await item.query_selector('div[data-testid="trend-name"]')
-                title = await title_elem.inner_text() if title_elem else ''
-                
-                if not title.strip():
-                    continue
-                
-                volume_elem = await item.query_selector('[data-testid="tweets"]')
-                volume = await volume_elem.inner_text() if volume_elem else 'N/A'
-                
-                trend = {
-                    'id': base_id + i,
-                    'title': title.strip(),
-                    'source': 'x_trends',
-                    'volume': volume,
-                    'timeframe': '24h trends'
-                }
-                trends.append(trend)
-            except:
+        for i, item in enumerate(items):
+            title = item['title'] or ''
+            if not title.strip():
                 continue
+            
+            volume = item['volume'] if item['volume'] is not None else 'N/A'
+            
+            trend = {
+                'id': base_id + i,
+                'title': title.strip(),
+                'source': 'x_trends',
+                'volume': volume,
+                'timeframe': '24h trends'
+            }
+            trends.append(trend)
         
-        await browser.close()
-        return trends
+        return trends, 'playwright'
+
+
+async def measure_load(pool, url, ready_selector, plan, viewport=None):
+    """Carga `url` con `plan` y devuelve las métricas de `PageMeter` (o el error)."""
+    options = {'viewport': viewport} if viewport else {}
+    async with pool.page(**options) as page:
+        meter = await PageMeter().attach(page)
+        try:
+            await plan.open(page, url, ready_selector, meter=meter)
+            return meter.as_dict()
+        except Exception as e:
+            return {'error': str(e)[:100]}
+        finally:
+            await meter.detach()
+
+
+async def measure():
+    """Modo --measure: bytes, peticiones y tiempo hasta el selector, con y sin bloqueo."""
+    targets = [
+        ('google', GOOGLE_URL.format(hours='24'), 'tr[data-row-id]', None),
+        ('trends24', "https://trends24.in/spain/", 'h2', X_VIEWPORT),
+        ('getdaytrends', "https://getdaytrends.com/spain/", '[data-testid="trend"]', X_VIEWPORT),
+    ]
+    print("📏 MEDICIÓN DE CARGA: sin bloqueo vs con bloqueo (misma condición de carga)")
+    async with BrowserPool() as pool:
+        # Una carga cada vez para que los tiempos no se contaminen entre sí
+        for source, url, ready_selector, viewport in targets:
+            plan = LOAD_PLANS[source]
+            for label, variant in (('sin bloqueo', plan.without_blocking()), ('con bloqueo', plan)):
+                m = await measure_load(pool, url, ready_selector, variant, viewport)
+                if 'error' in m:
+                    print(f"❌ {source:<13} {label}: {m['error']}")
+                else:
+                    print(f"📊 {source:<13} {label}: {m['kb']:>8} KB | {m['requests']:>3} peticiones | "
+                          f"{m['blocked']:>3} bloqueadas | selector en {m['time_to_selector']}s")
 
 
 async def main():
     print("🚀 GOOGLE TRENDS + X TRENDS ESPAÑA")
-    
-    print("🔄 Scraping Google Trends 24h...")
-    google_24h = await scrape_trends('24')
-    
-    print("🔄 Scraping Google Trends 4h...")
-    google_4h = await scrape_trends('4')
-    
-    print("🔄 Scraping X Trends...")
-    xtrends = await scrape_xtrends()
+    started = time.perf_counter()
+
+    # Un solo Chromium para toda la ejecución: Google 24h, Google 4h y X Trends
+    # se cargan a la vez, cada uno en su propia página
+    async with PeakRSSMonitor() as rss:
+        async with BrowserPool() as pool:
+            print(f"🌐 Chromium arrancado en {pool.startup_seconds:.2f}s | "
+                  f"bloqueo de recursos: {'sí' if BLOCKING else 'no'}")
+            print("🔄 Scraping Google Trends 24h + 4h y X Trends en paralelo...")
+            google_24h, google_4h, (xtrends, xtrends_report) = await asyncio.gather(
+                scrape_google_safe(pool, '24'),
+                scrape_google_safe(pool, '4'),
+                scrape_xtrends(pool)
+            )
+            startup_seconds = pool.startup_seconds
     
     # Combinar y ordenar por ID
     all_trends = google_24h + google_4h + xtrends
@@ -229,6 +417,7 @@ async def main():
         'summary': {
             'google_total': len(google_24h) + len(google_4h),
             'xtrends_total': len(xtrends),
+            **xtrends_report,
             'unique_total': len(unique_trends)
         },
         'trends': unique_trends
@@ -236,12 +425,30 @@ async def main():
     
     print(json.dumps(result, indent=2, ensure_ascii=False))
     
-    with open('trends_google&x.json', 'w', encoding='utf-8') as f:
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         json.dump(result, f, indent=2, ensure_ascii=False)
     
-    print("\n✅ Guardado: trends_google&x.json")
+    print(f"\n✅ Guardado: {OUTPUT_FILE}")
     print(f"📊 IDs: 1-99=Google | 100+=X | Total: {len(unique_trends)}")
+    print(f"⏱️ Total: {time.perf_counter() - started:.2f}s | "
+          f"arranque Chromium: {startup_seconds:.2f}s | RSS pico: {rss.peak_mb:.0f} MB")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description='Google Trends + X Trends España')
+    parser.add_argument('--measure', action='store_true',
+                        help='Comparar la carga de cada fuente con y sin bloqueo de recursos (no guarda JSON)')
+    parser.add_argument('--no-block', action='store_true',
+                        help='Cargar las páginas completas, sin abortar peticiones (comportamiento anterior)')
+    parser.add_argument('--trends24-mode', choices=['auto', 'http', 'playwright'], default=TRENDS24_MODE,
+                        help='auto: HTML estático con fallback a Playwright (por defecto)')
+    parser.add_argument('--xtrends-mode', choices=['hedged', 'parallel', 'sequential'], default=XTRENDS_MODE,
+                        help='Cómo competir entre fuentes X (por defecto hedged)')
+    parser.add_argument('--hedge-delay', type=float, default=XTRENDS_HEDGE_DELAY,
+                        help='Segundos antes de arrancar la siguiente fuente X en modo hedged')
+    args = parser.parse_args()
+    BLOCKING = not args.no_block
+    XTRENDS_MODE = args.xtrends_mode
+    XTRENDS_HEDGE_DELAY = {'hedged': args.hedge_delay, 'parallel': 0.0, 'sequential': None}[args.xtrends_mode]
+    TRENDS24_MODE = args.trends24_mode
+    asyncio.run(measure() if args.measure else main())